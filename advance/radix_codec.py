@@ -0,0 +1,187 @@
+"""
+Bulk radix codec for numbers written in bases 2-36 (see 12.py: int("24", 5)).
+
+Tokens are parsed straight from bytes (int() accepts bytes, so no str objects
+are created) and split divide-and-conquer style when they are too long for a
+single int() call. Bases 2, 8, 10 and 16 are formatted by the built-in
+formatter; other bases, and decimals past the int/str digit limit, split
+big ints by cached powers of the base.
+"""
+
+import sys
+from array import array
+from itertools import repeat
+
+DIGITS = b"0123456789abcdefghijklmnopqrstuvwxyz"
+# Valid digit bytes (both cases) for every base
+_VALID_DIGITS = {
+    base: DIGITS[:base] + DIGITS[10:base].upper() for base in range(2, 37)
+}
+# What bytes.split() separates tokens on
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+# Digit runs longer than this are split before calling int()
+_PARSE_LEAF = 1024
+# While this returns non-zero, int() itself refuses long digit runs in
+# bases that are not powers of two, the ones it parses in quadratic time
+_int_digit_limit = getattr(sys, "get_int_max_str_digits", lambda: 0)
+# Ints below base ** _FORMAT_LEAF digits are formatted directly
+_FORMAT_LEAF = 64
+# Bases the built-in formatter handles, with their format() spec
+_FORMAT_SPECS = {2: "b", 8: "o", 10: "d", 16: "x"}
+# (base, exponent) -> base ** exponent, for the divide-and-conquer splits
+_powers = {}
+
+def _power(base, exponent):
+    key = (base, exponent)
+    value = _powers.get(key)
+    if value is None:
+        value = _powers[key] = base ** exponent
+    return value
+
+def _check_base(base):
+    if not 2 <= base <= 36:
+        raise ValueError("Base must be between 2 and 36")
+
+def _parse_digits(digits, base):
+    """Parse an unsigned run of digit bytes of any length"""
+    if len(digits) <= _PARSE_LEAF:
+        return int(digits, base)
+    # Split at a power-of-two length so the powers are shared between calls
+    low_length = 1 << ((len(digits) - 1).bit_length() - 1)
+    high = _parse_digits(digits[:-low_length], base)
+    low = _parse_digits(digits[-low_length:], base)
+    return high * _power(base, low_length) + low
+
+def parse_radix(token, base):
+    """Parse one bytes token (optional leading '-') written in base"""
+    _check_base(base)
+    negative = token[:1] == b"-"
+    digits = token[1:] if negative else token
+    if not digits or digits.translate(None, _VALID_DIGITS[base]):
+        raise ValueError(f"Invalid base-{base} number: {bytes(token)!r}")
+    value = _parse_digits(digits, base)
+    return -value if negative else value
+
+def _parse_tokens(tokens, base, typecode, text, separators):
+    """Parse tokens with int(), screening text for what only int() accepts
+
+    text holds every token joined by separators. int() also allows
+    whitespace, '+', '_' between digits and 0x/0o/0b prefixes; any of those
+    leave bytes behind in one translate of text, and the tokens are then
+    parsed again by parse_radix, which reports the first bad one.
+    """
+    try:
+        if not _int_digit_limit() and max(map(len, tokens), default=0) > _PARSE_LEAF:
+            raise ValueError
+        # int() rejects bad digits and over-long tokens itself
+        values = list(map(int, tokens, repeat(base)))
+        if text.translate(None, _VALID_DIGITS[base] + b"-" + separators):
+            raise ValueError
+    except ValueError:
+        values = [parse_radix(token, base) for token in tokens]
+    return values if typecode is None else array(typecode, values)
+
+def parse_many(tokens, base, typecode=None):
+    """Parse an iterable of bytes tokens; returns a list or array(typecode)"""
+    _check_base(base)
+    tokens = list(tokens)
+    # int() rejects a comma, so it cannot hide inside a token
+    return _parse_tokens(tokens, base, typecode, b",".join(tokens), b",")
+
+def parse_lines(data, base, typecode=None):
+    """Parse a bytes buffer holding one number per line"""
+    _check_base(base)
+    return _parse_tokens(data.split(), base, typecode, data, _WHITESPACE)
+
+def parse_mixed(data):
+    """Parse whitespace-separated "base#digits" tokens such as b"16#ff 2#101" """
+    values = []
+    for token in data.split():
+        base, separator, digits = token.partition(b"#")
+        if not separator:
+            raise ValueError(f"Missing base in token: {token!r}")
+        values.append(parse_radix(digits, int(base)))
+    return values
+
+def iter_parse_stream(stream, base, chunk_size=1 << 20, typecode=None):
+    """Parse a binary stream of newline-delimited numbers in bounded chunks"""
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        chunk = pending + chunk
+        cut = chunk.rfind(b"\n") + 1
+        pending = chunk[cut:]
+        if cut:
+            yield parse_lines(chunk[:cut], base, typecode)
+    if pending.strip():
+        yield parse_lines(pending, base, typecode)
+
+# base -> every two-digit string in that base, indexed by value
+_digit_pairs = {}
+
+def _format_small(n, base):
+    """Digits of 0 <= n < base ** _FORMAT_LEAF"""
+    spec = _FORMAT_SPECS.get(base)
+    if spec is not None:
+        return format(n, spec).encode()
+    if n < base:
+        return DIGITS[n:n + 1]
+    pairs = _digit_pairs.get(base)
+    if pairs is None:
+        pairs = _digit_pairs[base] = [bytes((DIGITS[i // base], DIGITS[i % base]))
+                                      for i in range(base * base)]
+    # Two digits per divmod, most significant pair last
+    square = base * base
+    out = []
+    while n:
+        n, pair = divmod(n, square)
+        out.append(pairs[pair])
+    out.reverse()
+    return b"".join(out).lstrip(b"0")
+
+def _format_digits(n, base, width=0):
+    """Digits of n >= 0, zero-padded to width"""
+    if n < _power(base, _FORMAT_LEAF):
+        return _format_small(n, base).rjust(width, b"0")
+    # Largest power-of-two digit count whose power does not exceed n
+    low_length = _FORMAT_LEAF
+    while _power(base, 2 * low_length) <= n:
+        low_length *= 2
+    high, low = divmod(n, _power(base, low_length))
+    return _format_digits(high, base, width - low_length) + _format_digits(low, base, low_length)
+
+def format_radix(n, base):
+    """Format an int in base as bytes (lowercase digits)"""
+    _check_base(base)
+    spec = _FORMAT_SPECS.get(base)
+    if spec is not None:
+        try:
+            return format(n, spec).encode()
+        except ValueError:
+            # A decimal past the int/str digit limit
+            pass
+    if n < 0:
+        return b"-" + _format_digits(-n, base)
+    return _format_digits(n, base)
+
+def format_lines(numbers, base):
+    """Format an iterable of ints as newline-terminated bytes"""
+    _check_base(base)
+    numbers = list(numbers)
+    if not numbers:
+        return b""
+    spec = _FORMAT_SPECS.get(base)
+    if spec is not None:
+        try:
+            return ("\n".join(map(format, numbers, repeat(spec))) + "\n").encode()
+        except ValueError:
+            pass
+    return b"\n".join([format_radix(n, base) for n in numbers]) + b"\n"
+
+if __name__ == "__main__":
+    print(parse_radix(b"24", 5), parse_radix(b"65", 10))
+    print(parse_lines(b"101\n-11\n777\n", 8))
+    print(parse_mixed(b"16#ff 2#1010 36#zz"))
+    print(format_lines([255, -10, 1295], 16))
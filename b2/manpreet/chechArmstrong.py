@@ -1,11 +1,43 @@
+from functools import lru_cache
+from itertools import combinations_with_replacement
+
 def is_armstrong(number):
     digits = [int(d) for d in str(number)]
     power = len(digits)
     total = sum(d ** power for d in digits)
     return total == number
 
-num = int(input("Enter a number: "))
-if is_armstrong(num):
-    print(f"{num} is an Armstrong number.")
-else:
-    print(f"{num} is not an Armstrong number.")
\ No newline at end of file
+@lru_cache(maxsize=None)
+def digit_powers(power):
+    # d ** power for every digit character, shared by all calls
+    return {str(d): d ** power for d in range(10)}
+
+def is_armstrong_many(numbers):
+    # Returns a bytearray of 1/0 flags, one per number
+    flags = bytearray()
+    for number in numbers:
+        text = str(number)
+        powers = digit_powers(len(text))
+        flags.append(sum(powers[d] for d in text) == number)
+    return flags
+
+def armstrong_numbers(max_digits):
+    # Instead of testing every integer, try each multiset of digits once:
+    # the digit-power sum only depends on which digits occur, not their order
+    found = []
+    for length in range(1, max_digits + 1):
+        powers = [d ** length for d in range(10)]
+        low = 0 if length == 1 else 10 ** (length - 1)
+        high = 10 ** length
+        for digits in combinations_with_replacement("0123456789", length):
+            total = sum(powers[int(d)] for d in digits)
+            if low <= total < high and tuple(sorted(str(total))) == digits:
+                found.append(total)
+    return sorted(found)
+
+if __name__ == "__main__":
+    num = int(input("Enter a number: "))
+    if is_armstrong(num):
+        print(f"{num} is an Armstrong number.")
+    else:
+        print(f"{num} is not an Armstrong number.")
@@ -0,0 +1,178 @@
+"""
+Benchmark Suite: Asymptotic benchmarks for math_utils
+Sweeps each function over input sizes spanning orders of magnitude, records
+wall time and peak memory (tracemalloc), fits the empirical scaling exponent
+and writes everything as JSON. With --baseline it compares against a stored
+run and exits non-zero when a function got slower than the threshold allows.
+
+Usage:
+    python benchmark_math_utils.py --output bench.json
+    python benchmark_math_utils.py --baseline bench.json --threshold 1.5
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import timeit
+import tracemalloc
+
+import math_utils
+
+def _prime_near(n):
+    """Smallest prime >= n, so is_prime runs its full test"""
+    while not math_utils.is_prime(n):
+        n += 1
+    return n
+
+def _fibonacci_pair(k):
+    """Consecutive Fibonacci numbers, the worst case for Euclid's algorithm"""
+    return math_utils.fibonacci_nth(k), math_utils.fibonacci_nth(k - 1)
+
+def _reset_factorial_cache():
+    """Time factorial from scratch rather than from its memo"""
+    math_utils.factorial_cache_clear()
+
+# name -> (sizes, setup(size) -> args, function, before-each-run hook)
+BENCHMARKS = {
+    "factorial": ([10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5],
+                  lambda n: (n,), math_utils.factorial, _reset_factorial_cache),
+    "fibonacci": ([10 ** 2, 10 ** 3, 10 ** 4],
+                  lambda n: (n,), math_utils.fibonacci, None),
+    "fibonacci_nth": ([10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+                      lambda n: (n,), math_utils.fibonacci_nth, None),
+    "is_prime": ([10 ** 3, 10 ** 6, 10 ** 9, 10 ** 12, 10 ** 18],
+                 lambda n: (_prime_near(n),), math_utils.is_prime, None),
+    "prime_numbers": ([10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],
+                      lambda n: (n,), math_utils.prime_numbers, None),
+    "gcd": ([10 ** 2, 10 ** 3, 10 ** 4],
+            _fibonacci_pair, math_utils.gcd, None),
+    "lcm": ([10 ** 2, 10 ** 3, 10 ** 4],
+            _fibonacci_pair, math_utils.lcm, None),
+}
+
+def measure(func, args, before=None, repeat=3):
+    """Return (best seconds per call, peak traced bytes) for func(*args)"""
+    def run():
+        if before is not None:
+            before()
+        func(*args)
+
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    if before is not None:
+        before()
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+def fit_exponent(sizes, values):
+    """Least-squares slope of log(value) against log(size)"""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+def run_benchmarks(names=None, max_size=None, repeat=3):
+    """Run the selected benchmarks and return their results as a dict"""
+    results = {}
+    for name, (sizes, setup, func, before) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        if max_size is not None:
+            sizes = [s for s in sizes if s <= max_size]
+        rows = []
+        for size in sizes:
+            seconds, peak = measure(func, setup(size), before, repeat)
+            rows.append({"size": size, "seconds": seconds, "peak_bytes": peak})
+            print(f"  {name}({size:.0e}): {seconds * 1e6:.1f} us, peak {peak:,} bytes")
+        results[name] = {
+            "runs": rows,
+            "time_exponent": fit_exponent(sizes, [r["seconds"] for r in rows]),
+            "memory_exponent": fit_exponent(sizes, [r["peak_bytes"] for r in rows]),
+        }
+    return results
+
+def find_regressions(results, baseline, threshold, exponent_tolerance):
+    """List (name, what, change) for runs that regressed against the baseline
+
+    A run regresses when it is more than threshold times slower at the same
+    size, or when its fitted time exponent grew by more than exponent_tolerance.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+        old_times = {r["size"]: r["seconds"] for r in previous["runs"]}
+        for run in current["runs"]:
+            old = old_times.get(run["size"])
+            if old:
+                ratio = run["seconds"] / old
+                if ratio > threshold:
+                    regressions.append((name, f"n={run['size']:.0e}", f"{ratio:.2f}x slower"))
+        old_exponent, exponent = previous.get("time_exponent"), current["time_exponent"]
+        if old_exponent is not None and exponent is not None:
+            if exponent - old_exponent > exponent_tolerance:
+                regressions.append((name, "scaling", f"n^{old_exponent:.2f} -> n^{exponent:.2f}"))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asymptotic benchmarks for math_utils")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="allowed slowdown ratio against the baseline (default 1.5)")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.25,
+                        help="allowed growth of the scaling exponent (default 0.25)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--max-size", type=float, help="skip sizes above this")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats per size")
+    args = parser.parse_args(argv)
+
+    print("=== math_utils Benchmarks ===\n")
+    results = run_benchmarks(args.only, args.max_size, args.repeat)
+
+    print("\nScaling exponents (time ~ n^k):")
+    for name, result in results.items():
+        exponent = result["time_exponent"]
+        print(f"  {name}: {'n/a' if exponent is None else f'{exponent:.2f}'}")
+
+    report = {
+        "python": sys.version.split()[0],
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold,
+                                       args.exponent_tolerance)
+        if regressions:
+            print("\nRegressions against the baseline:")
+            for name, what, change in regressions:
+                print(f"  {name} ({what}): {change}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold}x baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
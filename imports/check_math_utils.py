@@ -0,0 +1,110 @@
+"""
+Reference Checks: math_utils against its original implementations
+The first versions of is_prime/prime_numbers used plain trial division.
+They are kept here as the reference, and the faster engines must agree
+with them. Exits non-zero on the first mismatch.
+
+Usage:
+    python check_math_utils.py
+"""
+
+import sys
+
+import math_utils
+
+def reference_is_prime(n):
+    """Original trial-division is_prime"""
+    if n < 2:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+def reference_prime_numbers(limit):
+    """Original prime_numbers: trial division on every candidate"""
+    primes = []
+    for num in range(2, limit + 1):
+        if reference_is_prime(num):
+            primes.append(num)
+    return primes
+
+def _check(label, got, expected):
+    if got != expected:
+        raise AssertionError(f"{label}: got {got!r}, expected {expected!r}")
+
+def check_primes(limit=5000):
+    """prime_numbers, iter_primes and iter_primes_between against trial division"""
+    expected = reference_prime_numbers(limit)
+    # Tiny limits, including the edge cases below the first odd prime
+    for n in range(-1, 40):
+        reference = [p for p in expected if p <= n]
+        _check(f"prime_numbers({n})", math_utils.prime_numbers(n), reference)
+        for segment_size in (1, 2, 3):
+            _check(f"iter_primes({n}, {segment_size})",
+                   list(math_utils.iter_primes(n, segment_size)), reference)
+    _check(f"prime_numbers({limit})", math_utils.prime_numbers(limit), expected)
+    # Limits on and around segment boundaries (a segment spans 2 * size numbers)
+    for segment_size in (1, 2, 7, 64, 100):
+        span = 2 * segment_size
+        for limit_ in {span, span + 1, span + 2, 3 * span, 3 * span + 3, limit}:
+            reference = [p for p in expected if p <= limit_]
+            _check(f"iter_primes({limit_}, {segment_size})",
+                   list(math_utils.iter_primes(limit_, segment_size)), reference)
+        segments = list(math_utils.iter_prime_segments(limit, segment_size))
+        _check(f"iter_prime_segments({limit}, {segment_size})",
+               [p for segment in segments for p in segment], expected)
+    # Ranges whose ends fall on primes, composites, evens and segment edges
+    bounds = [0, 1, 2, 3, 4, 5, 9, 10, 11, 12, 97, 98, 99, 100, 101, 1000, 4999]
+    for low in bounds:
+        for high in bounds:
+            reference = [p for p in expected if low <= p <= high]
+            for segment_size in (1, 3, 50):
+                _check(f"iter_primes_between({low}, {high}, {segment_size})",
+                       list(math_utils.iter_primes_between(low, high, segment_size)),
+                       reference)
+
+# Composites that fool weaker primality tests (Carmichael numbers and strong
+# pseudoprimes to several prime bases) and primes near the 64-bit limit
+_COMPOSITES = [561, 1105, 1729, 2047, 3215031751, 2152302898747, 3474749660383,
+               341550071728321, 3825123056546413051, 318665857834031151167461,
+               (2 ** 31 - 1) * (2 ** 61 - 1), 2 ** 64 - 1]
+_PRIMES = [2 ** 31 - 1, 2 ** 61 - 1, 2 ** 64 - 59,
+           2 ** 89 - 1, 2 ** 107 - 1]
+
+def check_is_prime(limit=20000):
+    """is_prime and is_prime_many against trial division and known values"""
+    numbers = list(range(-5, limit))
+    # Products of two primes just above the small-prime pre-filter
+    numbers += [p * q for p in (101, 103, 65537) for q in (101, 107, 65539, 999983)]
+    expected = [reference_is_prime(n) for n in numbers]
+    _check("is_prime", [math_utils.is_prime(n) for n in numbers], expected)
+    _check("is_prime_many", list(math_utils.is_prime_many(numbers)), list(map(int, expected)))
+    for n in _COMPOSITES:
+        _check(f"is_prime({n})", math_utils.is_prime(n), False)
+    for n in _PRIMES:
+        _check(f"is_prime({n})", math_utils.is_prime(n), True)
+    mixed = _PRIMES + _COMPOSITES + numbers[:100]
+    _check("is_prime_many(mixed sizes)", list(math_utils.is_prime_many(mixed)),
+           [int(math_utils.is_prime(n)) for n in mixed])
+
+CHECKS = {
+    "primes": check_primes,
+    "is_prime": check_is_prime,
+}
+
+def main():
+    print("=== math_utils reference checks ===")
+    failed = 0
+    for name, check in CHECKS.items():
+        try:
+            check()
+        except AssertionError as e:
+            failed += 1
+            print(f"  {name}: FAILED - {e}")
+        else:
+            print(f"  {name}: ok")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
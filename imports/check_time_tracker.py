@@ -0,0 +1,137 @@
+"""
+Reference Checks: program2_time_tracker batch helpers
+calculate_ages_many must agree with the per-person calculate_age on every
+input kind it accepts (lists, array.array, NumPy int columns, NumPy
+datetime64), including Feb 29 birthdays, and reject the same invalid dates.
+NumPy cases are skipped when NumPy is not installed. Exits non-zero on a
+mismatch.
+
+Usage:
+    python check_time_tracker.py
+"""
+
+import random
+import sys
+from array import array
+from datetime import date
+
+import program2_time_tracker as tracker
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _check(label, got, expected):
+    if got != expected:
+        raise AssertionError(f"{label}: got {got!r}, expected {expected!r}")
+
+def _expect_error(label, error, func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except error:
+        return
+    raise AssertionError(f"{label}: expected {error.__name__}")
+
+def _reference_ages(births, reference):
+    """calculate_age() for each birth date, with date.today() pinned to reference"""
+    class PinnedDate(date):
+        @classmethod
+        def today(cls):
+            return reference
+
+    real_date = tracker.date
+    tracker.date = PinnedDate
+    try:
+        return [tracker.calculate_age(b.year, b.month, b.day)[0] for b in births]
+    finally:
+        tracker.date = real_date
+
+def _birth_dates(count=5000, seed=20):
+    rng = random.Random(seed)
+    first, last = date(1900, 1, 1).toordinal(), date(2024, 12, 31).toordinal()
+    births = [date.fromordinal(rng.randint(first, last)) for _ in range(count)]
+    # Leap-day birthdays and the days around them
+    births += [date(2000, 2, 29), date(2004, 2, 29), date(1996, 2, 28), date(1996, 3, 1),
+               date(1999, 12, 31), date(2000, 1, 1)]
+    return births
+
+# Reference dates around a leap day, in leap and non-leap years
+REFERENCE_DATES = [date(2025, 2, 28), date(2025, 3, 1), date(2024, 2, 28),
+                   date(2024, 2, 29), date(2024, 3, 1), date(2025, 12, 31), date(2026, 1, 1)]
+
+def check_ages():
+    """calculate_ages_many against calculate_age for every input kind"""
+    births = _birth_dates()
+    years = [b.year for b in births]
+    months = [b.month for b in births]
+    days = [b.day for b in births]
+    for reference in REFERENCE_DATES:
+        expected = _reference_ages(births, reference)
+        _check(f"lists on {reference}",
+               list(tracker.calculate_ages_many(years, months, days, reference)), expected)
+        _check(f"array.array on {reference}",
+               list(tracker.calculate_ages_many(array('i', years), array('b', months),
+                                                array('b', days), reference)), expected)
+        if np is None:
+            continue
+        ages = tracker.calculate_ages_many(np.array(years), np.array(months, dtype=np.int8),
+                                           np.array(days), reference)
+        _check(f"NumPy int columns on {reference}", ages.tolist(), expected)
+        births64 = np.array([b.isoformat() for b in births], dtype='datetime64[D]')
+        _check(f"NumPy datetime64 on {reference}",
+               tracker.calculate_ages_many(births64, reference=reference).tolist(), expected)
+        _check(f"NumPy datetime64[s] on {reference}",
+               tracker.calculate_ages_many(births64.astype('datetime64[s]') + 3600,
+                                           reference=reference).tolist(), expected)
+    _check("default reference is today",
+           list(tracker.calculate_ages_many(years[:50], months[:50], days[:50])),
+           [tracker.calculate_age(b.year, b.month, b.day)[0] for b in births[:50]])
+
+def check_invalid_ages():
+    """Invalid dates raise ValueError like date(); a bare year column raises TypeError"""
+    invalid = [(2001, 2, 29), (1900, 2, 29), (2000, 13, 1), (2000, 0, 10),
+               (2000, 4, 31), (2000, 1, 0), (2000, 1, 32)]
+    for year, month, day in invalid:
+        _expect_error(f"date({year}, {month}, {day})", ValueError, date, year, month, day)
+        columns = ([2000, year], [1, month], [1, day])
+        _expect_error(f"lists {year}-{month}-{day}", ValueError,
+                      tracker.calculate_ages_many, *columns)
+        if np is not None:
+            _expect_error(f"NumPy {year}-{month}-{day}", ValueError,
+                          tracker.calculate_ages_many, *map(np.array, columns))
+    _expect_error("years only (list)", TypeError, tracker.calculate_ages_many, [1995, 2000])
+    for columns in (([2000], [1], [1, 2]), ([2000], [1, 2], [1]), ([2000, 2001], [1, 2], [1])):
+        _expect_error(f"mismatched list lengths {list(map(len, columns))}", ValueError,
+                      tracker.calculate_ages_many, *columns)
+    if np is not None:
+        _expect_error("years only (NumPy ints)", TypeError,
+                      tracker.calculate_ages_many, np.array([1995, 2000]),
+                      reference=date(2025, 2, 28))
+        _expect_error("NaT birth date", ValueError, tracker.calculate_ages_many,
+                      np.array(['2000-01-01', 'NaT'], dtype='datetime64[D]'))
+        _expect_error("mismatched lengths", ValueError, tracker.calculate_ages_many,
+                      np.array([2000, 2001]), np.array([1]), np.array([1, 2]))
+
+CHECKS = {
+    "ages": check_ages,
+    "invalid ages": check_invalid_ages,
+}
+
+def main():
+    print("=== program2_time_tracker reference checks ===")
+    if np is None:
+        print("  (NumPy not installed: NumPy cases skipped)")
+    failed = 0
+    for name, check in CHECKS.items():
+        try:
+            check()
+        except AssertionError as e:
+            failed += 1
+            print(f"  {name}: FAILED - {e}")
+        else:
+            print(f"  {name}: ok")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
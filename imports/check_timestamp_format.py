@@ -0,0 +1,131 @@
+"""
+Reference Checks: timestamp_format against strftime
+Every compiled pattern must produce exactly what datetime.strftime gives,
+for random datetimes and epoch seconds in local time, UTC and fixed
+offsets, and when one compiled format is shared by several threads.
+Exits non-zero on a mismatch.
+
+Usage:
+    python check_timestamp_format.py
+"""
+
+import random
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+from timestamp_format import compile_format
+
+PATTERNS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%A, %B %d at %H:%M",
+    "%a %b %e %I:%M:%S %p",
+    "%I%p %j %U %W %u %w",
+    "%G-W%V %y %C %D %F",
+    "100%% at %H%%%M %%Y",
+    "%H",
+    "no directives",
+    "%Y%",
+    # No plan for these: they use the strftime fallback
+    "%c %z",
+    "%x %X %Z",
+]
+
+TIMEZONES = [None, timezone.utc, timezone(timedelta(hours=5, minutes=30)),
+             timezone(timedelta(hours=-8))]
+
+def _check(label, got, expected):
+    if got != expected:
+        mismatch = next(i for i, (a, b) in enumerate(zip(got, expected)) if a != b) \
+            if len(got) == len(expected) else None
+        detail = (f"row {mismatch}: {got[mismatch]!r} != {expected[mismatch]!r}"
+                  if mismatch is not None else f"{len(got)} rows != {len(expected)}")
+        raise AssertionError(f"{label}: {detail}")
+
+def _epochs(rng, count):
+    """Sorted runs (to hit the same-day reuse) mixed with random jumps"""
+    epochs = []
+    while len(epochs) < count:
+        start = rng.randint(-2 * 10 ** 9, 4 * 10 ** 9)
+        epochs.extend(start + rng.randint(0, 5000) * step
+                      for step in range(rng.randint(1, 50)))
+    return epochs[:count]
+
+def check_epochs(count=1500, seed=24):
+    """Integer and float epoch seconds in local time, UTC and fixed offsets"""
+    rng = random.Random(seed)
+    seconds = _epochs(rng, count)
+    fractional = [s + rng.random() for s in seconds]
+    for tz in TIMEZONES:
+        for values, kind in ((seconds, "int"), (fractional, "float")):
+            stamps = [datetime.fromtimestamp(value, tz) for value in values]
+            for pattern in PATTERNS:
+                _check(f"{pattern!r} {kind} tz={tz}",
+                       compile_format(pattern).format_many(values, tz=tz),
+                       [stamp.strftime(pattern) for stamp in stamps])
+
+def check_datetimes(count=1500, seed=24):
+    """Naive and aware datetimes, including reuse of the output list"""
+    rng = random.Random(seed)
+    base = datetime(1900, 1, 1)
+    for tz in TIMEZONES:
+        stamps = sorted(base + timedelta(seconds=rng.randint(0, 200 * 365 * 86400),
+                                         microseconds=rng.randint(0, 999999))
+                        for _ in range(count))
+        if tz is not None:
+            stamps = [stamp.replace(tzinfo=tz) for stamp in stamps]
+        out = ["stale"]
+        for pattern in PATTERNS:
+            formatted = compile_format(pattern).format_many(stamps, out)
+            _check(f"{pattern!r} datetimes tz={tz}", formatted,
+                   [stamp.strftime(pattern) for stamp in stamps])
+            if formatted is not out:
+                raise AssertionError("format_many did not fill the given list")
+    single = datetime(2024, 2, 29, 0, 0, 0, 7)
+    for pattern in PATTERNS:
+        _check(f"format({pattern!r})", [compile_format(pattern).format(single)],
+               [single.strftime(pattern)])
+
+def check_threads(threads=4, per_thread=86000):
+    """One shared compiled format used concurrently must not mix up fields"""
+    pattern = "%Y-%m-%d %I:%M:%S %p"
+    formatter = compile_format(pattern)
+    errors = []
+
+    def work(offset):
+        values = list(range(offset, offset + per_thread)) * 3
+        got = formatter.format_many(values, tz=timezone.utc)
+        expected = [datetime.fromtimestamp(v, timezone.utc).strftime(pattern) for v in values]
+        errors.append(sum(a != b for a, b in zip(got, expected)))
+
+    workers = [threading.Thread(target=work, args=(1_700_000_000 + 7919 * i,))
+               for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if any(errors):
+        raise AssertionError(f"{sum(errors)} wrong strings across {threads} threads")
+
+CHECKS = {
+    "epoch seconds": check_epochs,
+    "datetimes": check_datetimes,
+    "threads": check_threads,
+}
+
+def main():
+    print("=== timestamp_format reference checks ===")
+    failed = 0
+    for name, check in CHECKS.items():
+        try:
+            check()
+        except AssertionError as e:
+            failed += 1
+            print(f"  {name}: FAILED - {e}")
+        else:
+            print(f"  {name}: ok")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Factorization: Prime factorization built on math_utils
+Small numbers are factored in bulk from a smallest-prime-factor (SPF) table
+that is sieved once; large numbers use trial division by small primes and
+then Pollard-Brent rho, with math_utils.is_prime deciding when to stop.
+Factorizations are returned as tuples of (prime, exponent) pairs.
+"""
+
+import math
+import random
+from array import array
+from collections import Counter
+
+import math_utils
+
+# Largest SPF table factorize_many builds on its own (about 40 MB)
+SPF_TABLE_LIMIT = 10 ** 7
+# Primes tried by division before switching to Pollard-Brent rho
+_TRIAL_PRIMES = tuple(math_utils.prime_numbers(1000))
+# A cofactor below this has no factor under 1000, so it is prime
+_TRIAL_BOUND = 1009 * 1009
+
+def build_spf_table(limit):
+    """Sieve the smallest prime factor of every n <= limit into an array"""
+    if limit < 0:
+        raise ValueError("Table limit cannot be negative")
+    typecode = 'I' if limit < 2 ** 32 else 'Q'
+    spf = array(typecode, bytes(array(typecode).itemsize * (limit + 1)))
+    # Mark multiples of larger primes first so smaller primes overwrite them
+    for p in reversed(math_utils.prime_numbers(limit)):
+        spf[p] = p
+        start = p * p
+        if start <= limit:
+            spf[start::p] = array(typecode, [p]) * len(range(start, limit + 1, p))
+    return spf
+
+def _factorize_with_table(n, spf):
+    """Factor n (1 <= n < len(spf)) by following smallest prime factors"""
+    factors = []
+    while n > 1:
+        p = spf[n]
+        exponent = 0
+        while n % p == 0:
+            n //= p
+            exponent += 1
+        factors.append((p, exponent))
+    return tuple(factors)
+
+def _pollard_brent(n):
+    """Find a non-trivial factor of the odd composite n"""
+    while True:
+        y, c = random.randrange(1, n), random.randrange(1, n)
+        batch = 128  # gcd checks are batched over this many steps
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            # The batch overshot; replay it one step at a time
+            while True:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+                if g > 1:
+                    break
+        if g != n:
+            return g
+
+def _factorize_large(n):
+    """Factor n by trial division by small primes, then Pollard-Brent rho"""
+    counts = Counter()
+    for p in _TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            n //= p
+            counts[p] += 1
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if m < _TRIAL_BOUND or math_utils.is_prime(m):
+            counts[m] += 1
+        else:
+            d = _pollard_brent(m)
+            pending.extend((d, m // d))
+    return tuple(sorted(counts.items()))
+
+def factorize(n, spf=None):
+    """Return the prime factorization of n as ((prime, exponent), ...)"""
+    if n < 1:
+        raise ValueError("Factorization is only defined for positive integers")
+    if spf is not None and n < len(spf):
+        return _factorize_with_table(n, spf)
+    return _factorize_large(n)
+
+def factorize_many(numbers, spf=None):
+    """Factor many numbers, sharing one SPF table for the small ones"""
+    numbers = list(numbers)
+    if not numbers:
+        return []
+    if min(numbers) < 1:
+        raise ValueError("Factorization is only defined for positive integers")
+    if spf is None:
+        # Size the table for the largest number it can serve; skip it if none fit
+        small = max((n for n in numbers if n <= SPF_TABLE_LIMIT), default=None)
+        spf = build_spf_table(small) if small is not None else ()
+    table_size = len(spf)
+    return [_factorize_with_table(n, spf) if n < table_size else _factorize_large(n)
+            for n in numbers]
+
+def expand_factors(factors):
+    """Multiply a ((prime, exponent), ...) factorization back into an integer"""
+    return math.prod(p ** e for p, e in factors)
+
+def main():
+    print("=== Prime Factorization ===\n")
+
+    for n in (360, 97, 2 ** 32 + 1, 600851475143, 2 ** 64 - 1):
+        factors = factorize(n)
+        text = " * ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in factors)
+        print(f"  {n} = {text}")
+
+    numbers = list(range(2, 12))
+    print("\nBulk factorization with a shared SPF table:")
+    for n, factors in zip(numbers, factorize_many(numbers)):
+        print(f"  {n}: {factors}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Lazy Imports: Deferred module loading with an import-time report
+lazy_import() returns a stand-in module that performs the real import on
+first attribute access, so short runs only pay for the modules they use.
+Every import made through this layer is timed, and import_report() /
+check_import_budget() turn those timings into a startup budget.
+"""
+
+import importlib
+import sys
+import time
+import types
+
+# module name -> microseconds spent importing it (including its own imports)
+_import_times = {}
+
+def timed_import(name):
+    """Import a module now, recording how long it took"""
+    module = sys.modules.get(name)
+    if module is not None and not isinstance(module, LazyModule):
+        return module
+    start = time.perf_counter_ns()
+    module = importlib.import_module(name)
+    _import_times[name] = (time.perf_counter_ns() - start) // 1000
+    return module
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __getattr__(self, attr):
+        # Only reached for names not yet in __dict__, i.e. before the load
+        module = timed_import(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+def lazy_import(name):
+    """Return name's module if already imported, otherwise a lazy stand-in"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+def import_report():
+    """List (module, microseconds, cumulative microseconds) in load order"""
+    report = []
+    total = 0
+    for name, micros in _import_times.items():
+        total += micros
+        report.append((name, micros, total))
+    return report
+
+def print_import_report():
+    """Print the import timings recorded so far"""
+    report = import_report()
+    width = max([len(name) for name, _, _ in report] + [6]) + 2
+    print(f"{'Module':<{width}}{'us':>10}{'cumulative us':>16}")
+    for name, micros, total in report:
+        print(f"{name:<{width}}{micros:>10}{total:>16}")
+
+def check_import_budget(budget_us):
+    """Raise RuntimeError if the recorded imports took more than budget_us"""
+    total = sum(_import_times.values())
+    if total > budget_us:
+        slowest = max(_import_times, key=_import_times.get)
+        raise RuntimeError(
+            f"Imports took {total} us, over the {budget_us} us budget "
+            f"(slowest: {slowest}, {_import_times[slowest]} us)")
+    return total
+
+def lazy_attributes(module_globals, **builders):
+    """Build a module-level __getattr__ (PEP 562) for expensive attributes
+
+    Each builder runs on first access to its name; the result is stored in
+    the module's globals so later lookups never reach __getattr__ again.
+    """
+    module_name = module_globals["__name__"]
+
+    def __getattr__(name):
+        builder = builders.get(name)
+        if builder is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        start = time.perf_counter_ns()
+        value = module_globals[name] = builder()
+        _import_times[f"{module_name}.{name}"] = (time.perf_counter_ns() - start) // 1000
+        return value
+
+    return __getattr__
@@ -4,22 +4,161 @@ This is a custom module that will be imported by program5_custom_import.py
 Save this as: math_utils.py
 """
 
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque, namedtuple
+from itertools import chain, compress, islice
+
+from lazy_imports import lazy_attributes, lazy_import
+
+# Only the precise_* constants need decimal, so it loads on first use
+decimal = lazy_import('decimal')
+
 # Constants
 PI = 3.14159265359
 E = 2.71828182846
 GOLDEN_RATIO = 1.61803398875
 
+# Extra digits computed beyond each request to absorb truncation error
+_CONSTANT_GUARD_DIGITS = 10
+# name -> (digits, constant * 10**digits) for the most precise value computed
+_constant_cache = {}
+
+def _chudnovsky_split(a, b):
+    """Binary splitting of the Chudnovsky series terms a..b-1 into (P, Q, T)"""
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * 10939058860032000  # 640320**3 // 24
+        t = p * (13591409 + 545140134 * a)
+        return p, q, -t if a & 1 else t
+    mid = (a + b) // 2
+    p1, q1, t1 = _chudnovsky_split(a, mid)
+    p2, q2, t2 = _chudnovsky_split(mid, b)
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+def _scaled_pi(digits):
+    """floor(pi * 10**digits), up to the guard-digit error"""
+    one = 10 ** digits
+    terms = digits // 14 + 2  # each term adds about 14.18 digits
+    _, q, t = _chudnovsky_split(0, terms)
+    return q * 426880 * math.isqrt(10005 * one * one) // t
+
+def _e_split(a, b):
+    """Binary splitting of sum(a! / k! for k in a+1..b) into (P, Q)"""
+    if b - a == 1:
+        return 1, b
+    mid = (a + b) // 2
+    p1, q1 = _e_split(a, mid)
+    p2, q2 = _e_split(mid, b)
+    return p1 * q2 + p2, q1 * q2
+
+def _scaled_e(digits):
+    """floor(e * 10**digits), up to the guard-digit error"""
+    # Sum 1/k! until k! exceeds 10**digits
+    terms, magnitude = 1, 0.0
+    while magnitude < digits:
+        terms += 1
+        magnitude += math.log10(terms)
+    p, q = _e_split(0, terms)
+    one = 10 ** digits
+    return one + p * one // q
+
+def _scaled_golden_ratio(digits):
+    """floor(phi * 10**digits), up to the guard-digit error"""
+    one = 10 ** digits
+    # math.isqrt refines sqrt(5) by Newton iterations at doubling precision
+    return (one + math.isqrt(5 * one * one)) // 2
+
+def _precise_constant(name, compute, digits):
+    """Return a constant to digits decimal places as a Decimal (truncated)"""
+    if digits < 0:
+        raise ValueError("Number of digits cannot be negative")
+    cached = _constant_cache.get(name)
+    if cached is None or cached[0] < digits:
+        working = digits + _CONSTANT_GUARD_DIGITS
+        cached = (digits, compute(working) // 10 ** _CONSTANT_GUARD_DIGITS)
+        _constant_cache[name] = cached
+    # Serve lower precision by truncating the most precise cached value
+    scaled = cached[1] // 10 ** (cached[0] - digits)
+    # A context wide enough for every digit keeps scaleb exact
+    return decimal.Decimal(scaled).scaleb(-digits, decimal.Context(prec=digits + 2))
+
+def precise_pi(digits):
+    """PI to digits decimal places (Chudnovsky series with binary splitting)"""
+    return _precise_constant('pi', _scaled_pi, digits)
+
+def precise_e(digits):
+    """E to digits decimal places (factorial series with binary splitting)"""
+    return _precise_constant('e', _scaled_e, digits)
+
+def precise_golden_ratio(digits):
+    """GOLDEN_RATIO to digits decimal places, from sqrt(5) by Newton's method"""
+    return _precise_constant('golden_ratio', _scaled_golden_ratio, digits)
+
+FactorialCacheInfo = namedtuple(
+    'FactorialCacheInfo', ['hits', 'extensions', 'misses', 'maxsize', 'currsize'])
+
+# Recent factorials (n -> n!), least recently used first
+_factorial_cache = OrderedDict()
+_factorial_cache_maxsize = 32
+_factorial_stats = {'hits': 0, 'extensions': 0, 'misses': 0}
+# Below this n the product is cheaper than a cache lookup
+_FACTORIAL_CACHE_MIN = 128
+
+def _range_product(low, high):
+    """Multiply the integers in [low, high) by balanced binary splitting"""
+    if high - low <= 16:
+        return math.prod(range(low, high))
+    mid = (low + high) // 2
+    return _range_product(low, mid) * _range_product(mid, high)
+
 def factorial(n):
     """Calculate factorial of n"""
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
-    if n == 0 or n == 1:
-        return 1
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
+    if n < _FACTORIAL_CACHE_MIN:
+        return _range_product(2, n + 1)
+    cache = _factorial_cache
+    if n in cache:
+        _factorial_stats['hits'] += 1
+        cache.move_to_end(n)
+        return cache[n]
+    # Extend the largest cached factorial below n instead of starting at 1
+    start = max((m for m in cache if m < n), default=None)
+    if start is None:
+        _factorial_stats['misses'] += 1
+        result = _range_product(2, n + 1)
+    else:
+        _factorial_stats['extensions'] += 1
+        cache.move_to_end(start)
+        result = cache[start] * _range_product(start + 1, n + 1)
+    if _factorial_cache_maxsize > 0:
+        cache[n] = result
+        while len(cache) > _factorial_cache_maxsize:
+            cache.popitem(last=False)
     return result
 
+def factorial_cache_info():
+    """Report factorial memo hits, extensions, misses and size"""
+    return FactorialCacheInfo(maxsize=_factorial_cache_maxsize,
+                              currsize=len(_factorial_cache), **_factorial_stats)
+
+def factorial_cache_clear(maxsize=None):
+    """Empty the factorial memo and reset its statistics, optionally resizing it"""
+    global _factorial_cache_maxsize
+    if maxsize is not None:
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        _factorial_cache_maxsize = maxsize
+    _factorial_cache.clear()
+    for key in _factorial_stats:
+        _factorial_stats[key] = 0
+
 def fibonacci(n):
     """Generate first n Fibonacci numbers"""
     if n <= 0:
@@ -34,56 +173,261 @@ def fibonacci(n):
         fib_sequence.append(fib_sequence[i-1] + fib_sequence[i-2])
     return fib_sequence
 
+def fibonacci_nth(n):
+    """Return the nth Fibonacci number (F(0) = 0) using fast doubling"""
+    if n < 0:
+        raise ValueError("Fibonacci is not defined for negative indexes")
+    a, b = 0, 1  # F(k), F(k + 1) for the bits of n read so far
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == "1":
+            a, b = b, a + b
+    return a
+
+def iter_fibonacci(count=None):
+    """Lazily yield Fibonacci numbers, forever or for count terms"""
+    a, b = 0, 1
+    if count is None:
+        while True:
+            yield a
+            a, b = b, a + b
+    for _ in range(count):
+        yield a
+        a, b = b, a + b
+
+# Small primes used to reject most composites with a single gcd call
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+_SMALL_PRIME_SET = frozenset(_SMALL_PRIMES)
+_SMALL_PRIMORIAL = math.prod(_SMALL_PRIMES)
+# Anything below 101**2 that survives the small-prime filter is prime
+_TRIVIAL_PRIME_BOUND = 101 * 101
+
+# Miller-Rabin witness sets that are deterministic below each bound;
+# the last one covers every n < 2**64
+_MR_WITNESSES = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981,
+     (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+def _witness_range(n):
+    """Return (lower, upper, witnesses) for the witness set that covers n"""
+    lower = 0
+    for upper, witnesses in _MR_WITNESSES:
+        if n < upper:
+            return lower, upper, witnesses
+        lower = upper
+    # Beyond the table the test is a strong probable-prime check
+    return lower, math.inf, _MR_WITNESSES[-1][1]
+
+def _miller_rabin(n, witnesses):
+    """Strong pseudoprime test of odd n > 2 against the given witnesses"""
+    n_minus_1 = n - 1
+    s = (n_minus_1 & -n_minus_1).bit_length() - 1
+    d = n_minus_1 >> s
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n_minus_1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n_minus_1:
+                break
+        else:
+            return False
+    return True
+
 def is_prime(n):
-    """Check if a number is prime"""
+    """Check if a number is prime (deterministic Miller-Rabin for n < 2**64)"""
     if n < 2:
         return False
-    for i in range(2, int(n ** 0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
+    if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+        return n in _SMALL_PRIME_SET
+    if n < _TRIVIAL_PRIME_BOUND:
+        return True
+    return _miller_rabin(n, _witness_range(n)[2])
+
+def is_prime_many(numbers):
+    """Check many numbers for primality; returns a bytearray of 0/1 flags"""
+    gcd = math.gcd
+    primorial = _SMALL_PRIMORIAL
+    small_primes = _SMALL_PRIME_SET
+    trivial_bound = _TRIVIAL_PRIME_BOUND
+    miller_rabin = _miller_rabin
+    # Reuse the current witness set while numbers stay inside its range
+    lower, upper, witnesses = _witness_range(trivial_bound)
+    flags = bytearray()
+    append = flags.append
+    for n in numbers:
+        if n < 2:
+            append(0)
+        elif gcd(n, primorial) != 1:
+            append(n in small_primes)
+        elif n < trivial_bound:
+            append(1)
+        else:
+            if not lower <= n < upper:
+                lower, upper, witnesses = _witness_range(n)
+            append(miller_rabin(n, witnesses))
+    return flags
+
+# Odd numbers sieved per segment (one byte each), keeps memory bounded
+SIEVE_SEGMENT_SIZE = 1 << 18
+
+def _odd_base_primes(limit):
+    """Sieve the odd primes up to limit in a single bytearray"""
+    if limit < 3:
+        return []
+    # Index i stands for the odd number 2*i + 1
+    size = (limit - 1) // 2 + 1
+    sieve = bytearray([1]) * size
+    sieve[0] = 0
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, size, p)))
+    return list(compress(range(1, limit + 1, 2), sieve))
+
+# Odd primes below 2**16, enough to sieve any limit below 2**32
+_BASE_PRIMES_LIMIT = 1 << 16
+
+def _get_base_primes():
+    """The shared BASE_PRIMES table, built on first use"""
+    table = globals().get('BASE_PRIMES')
+    if table is None:
+        table = globals()['BASE_PRIMES'] = array('I', _odd_base_primes(_BASE_PRIMES_LIMIT))
+    return table
+
+def _base_primes(limit):
+    """Odd primes up to limit, cut from the shared BASE_PRIMES table if possible"""
+    if limit > _BASE_PRIMES_LIMIT:
+        return _odd_base_primes(limit)
+    table = _get_base_primes()
+    return table[:bisect_right(table, limit)]
+
+def _sieve_segment(low, high, base_primes):
+    """Sieve the odd numbers in [low, high) with odd base primes; low must be odd"""
+    size = (high - low + 1) // 2
+    segment = bytearray([1]) * size
+    for p in base_primes:
+        square = p * p
+        if square >= high:
+            break
+        if square >= low:
+            start = square
+        else:
+            # First odd multiple of p that is >= low
+            start = -(-low // p) * p
+            if start % 2 == 0:
+                start += p
+        # Consecutive odd multiples are 2p apart, i.e. p slots apart
+        index = (start - low) // 2
+        segment[index::p] = bytes(len(range(index, size, p)))
+    return segment
+
+def iter_prime_segments(limit, segment_size=SIEVE_SEGMENT_SIZE):
+    """Yield the primes up to limit as one list per sieved segment"""
+    if segment_size < 1:
+        raise ValueError("Segment size must be positive")
+    if limit < 2:
+        return
+    base_primes = _base_primes(math.isqrt(limit))
+    span = 2 * segment_size
+    first = True
+    for low in range(3, limit + 1, span):
+        high = min(low + span, limit + 1)
+        segment = _sieve_segment(low, high, base_primes)
+        primes = list(compress(range(low, high, 2), segment))
+        if first:
+            primes.insert(0, 2)
+            first = False
+        yield primes
+    if first:
+        yield [2]
+
+def iter_primes(limit, segment_size=SIEVE_SEGMENT_SIZE):
+    """Lazily yield all prime numbers up to limit, one segment at a time"""
+    return chain.from_iterable(iter_prime_segments(limit, segment_size))
+
+def iter_primes_between(low, high, segment_size=SIEVE_SEGMENT_SIZE):
+    """Lazily yield the primes p with low <= p <= high"""
+    if segment_size < 1:
+        raise ValueError("Segment size must be positive")
+    if high < 2 or low > high:
+        return
+    if low <= 2:
+        yield 2
+    low = max(low, 3) | 1
+    base_primes = _base_primes(math.isqrt(high))
+    span = 2 * segment_size
+    for start in range(low, high + 1, span):
+        stop = min(start + span, high + 1)
+        yield from compress(range(start, stop, 2), _sieve_segment(start, stop, base_primes))
 
 def prime_numbers(limit):
     """Generate all prime numbers up to limit"""
-    primes = []
-    for num in range(2, limit + 1):
-        if is_prime(num):
-            primes.append(num)
-    return primes
+    return list(iter_primes(limit))
+
+# Calculator history op codes
+OP_ADD, OP_SUBTRACT, OP_MULTIPLY, OP_DIVIDE = range(4)
+
+# History message templates: (two-operand form, running-result form)
+_HISTORY_FORMATS = {
+    OP_ADD: ("Added {0} + {1} = {2}", "Added {0}, Result: {2}"),
+    OP_SUBTRACT: ("Subtracted {0} - {1} = {2}", "Subtracted {0}, Result: {2}"),
+    OP_MULTIPLY: ("Multiplied {0} * {1} = {2}", None),
+    OP_DIVIDE: ("Divided {0} / {1} = {2}", None),
+}
+
+DEFAULT_HISTORY_SIZE = 1000
 
 class Calculator:
     """A simple calculator class"""
 
-    def __init__(self):
+    __slots__ = ('result', '_history')
+
+    def __init__(self, history_size=DEFAULT_HISTORY_SIZE):
         self.result = 0
-        self.history = []
+        # Ring buffer of (op, x, y, result); y is None for running-result ops
+        self._history = deque(maxlen=history_size)
 
     def add(self, x, y=None):
         """Add numbers"""
         if y is None:
             self.result += x
-            self.history.append(f"Added {x}, Result: {self.result}")
+            self._history.append((OP_ADD, x, None, self.result))
             return self.result
         else:
             result = x + y
-            self.history.append(f"Added {x} + {y} = {result}")
+            self._history.append((OP_ADD, x, y, result))
             return result
 
     def subtract(self, x, y=None):
         """Subtract numbers"""
         if y is None:
             self.result -= x
-            self.history.append(f"Subtracted {x}, Result: {self.result}")
+            self._history.append((OP_SUBTRACT, x, None, self.result))
             return self.result
         else:
             result = x - y
-            self.history.append(f"Subtracted {x} - {y} = {result}")
+            self._history.append((OP_SUBTRACT, x, y, result))
             return result
 
     def multiply(self, x, y):
         """Multiply numbers"""
         result = x * y
-        self.history.append(f"Multiplied {x} * {y} = {result}")
+        self._history.append((OP_MULTIPLY, x, y, result))
         return result
 
     def divide(self, x, y):
@@ -91,17 +435,125 @@ class Calculator:
         if y == 0:
             raise ValueError("Cannot divide by zero")
         result = x / y
-        self.history.append(f"Divided {x} / {y} = {result}")
+        self._history.append((OP_DIVIDE, x, y, result))
         return result
 
     def clear(self):
         """Clear calculator"""
         self.result = 0
-        self.history = []
+        self._history.clear()
 
     def get_history(self):
         """Get calculation history"""
-        return self.history
+        formats = _HISTORY_FORMATS
+        return [formats[op][y is None].format(x, y, result)
+                for op, x, y, result in self._history]
+
+    @property
+    def history(self):
+        """Formatted calculation history (same as get_history())"""
+        return self.get_history()
+
+class CalculatorProgram:
+    """A recorded chain of Calculator operations that runs over whole columns"""
+
+    __slots__ = ('_steps',)
+
+    def __init__(self):
+        # List of (op, operand); operand is a scalar or a column
+        self._steps = []
+
+    def add(self, y):
+        """Record adding y to the running result"""
+        self._steps.append((OP_ADD, y))
+        return self
+
+    def subtract(self, y):
+        """Record subtracting y from the running result"""
+        self._steps.append((OP_SUBTRACT, y))
+        return self
+
+    def multiply(self, y):
+        """Record multiplying the running result by y"""
+        self._steps.append((OP_MULTIPLY, y))
+        return self
+
+    def divide(self, y):
+        """Record dividing the running result by y"""
+        self._steps.append((OP_DIVIDE, y))
+        return self
+
+    def run(self, values, mask_zero_division=False):
+        """Run the program over a list, array.array or NumPy array of start values
+
+        Division by zero raises ValueError like Calculator.divide. With
+        mask_zero_division=True those rows become nan instead and
+        (results, valid) is returned, valid being a per-row flag array.
+        array.array input comes back with its typecode when the results fit,
+        as array('d') when they are floats, and as a list when they overflow.
+        """
+        np = numpy_for(values) or next(
+            (numpy_for(y) for _, y in self._steps if numpy_for(y) is not None), None)
+        if np is not None:
+            return self._run_numpy(np, values, mask_zero_division)
+        count = len(values)
+        results = list(values)
+        valid = bytearray([1]) * count if mask_zero_division else None
+        for op, y in self._steps:
+            column = isinstance(y, (list, tuple, array))
+            if column and len(y) != count:
+                raise ValueError("Operand column must match the input length")
+            operands = y if column else [y] * count
+            if op == OP_ADD:
+                results = [x + b for x, b in zip(results, operands)]
+            elif op == OP_SUBTRACT:
+                results = [x - b for x, b in zip(results, operands)]
+            elif op == OP_MULTIPLY:
+                results = [x * b for x, b in zip(results, operands)]
+            elif 0 not in operands:
+                results = [x / b for x, b in zip(results, operands)]
+            elif valid is None:
+                raise ValueError("Cannot divide by zero")
+            else:
+                for i, b in enumerate(operands):
+                    if b == 0:
+                        valid[i] = 0
+                        results[i] = math.nan
+                    else:
+                        results[i] = results[i] / b
+        if isinstance(values, array):
+            # Narrow back to the input typecode only when every result fits
+            try:
+                results = array(values.typecode, results)
+            except TypeError:
+                results = array('d', results)
+            except OverflowError:
+                pass
+        return results if valid is None else (results, valid)
+
+    def _run_numpy(self, np, values, mask_zero_division):
+        """Vectorized run() for NumPy inputs"""
+        results = np.asarray(values)
+        valid = np.ones(results.shape, dtype=bool) if mask_zero_division else None
+        for op, y in self._steps:
+            y = np.asarray(y)
+            if op == OP_ADD:
+                results = results + y
+            elif op == OP_SUBTRACT:
+                results = results - y
+            elif op == OP_MULTIPLY:
+                results = results * y
+            else:
+                zero = np.broadcast_to(y == 0, results.shape)
+                if not zero.any():
+                    results = results / y
+                elif valid is None:
+                    raise ValueError("Cannot divide by zero")
+                else:
+                    valid &= ~zero
+                    results = results / np.where(y == 0, 1, y)
+                    results[zero] = np.nan
+        return results if valid is None else (results, valid)
 
 # Module-level function
 def gcd(a, b):
@@ -114,6 +566,105 @@ def lcm(a, b):
     """Calculate Least Common Multiple"""
     return abs(a * b) // gcd(a, b)
 
+# Numbers handed to math.gcd/math.lcm per call when reducing sequences
+_REDUCE_CHUNK = 4096
+
+def numpy_for(values):
+    """Return numpy if values is a NumPy array (without importing numpy)"""
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(values, np.ndarray):
+        return np
+    return None
+
+def _chunks(values):
+    """Yield lists of up to _REDUCE_CHUNK items from any iterable"""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, _REDUCE_CHUNK))
+        if not chunk:
+            return
+        yield chunk
+
+def gcd_many(values):
+    """GCD of a list, array.array or NumPy array; stops early once it hits 1"""
+    np = numpy_for(values)
+    result = 0
+    if np is not None:
+        flat = values.ravel()
+        for start in range(0, flat.size, _REDUCE_CHUNK):
+            result = math.gcd(result, int(np.gcd.reduce(flat[start:start + _REDUCE_CHUNK])))
+            if result == 1:
+                break
+        return result
+    for chunk in _chunks(values):
+        result = math.gcd(result, *chunk)
+        if result == 1:
+            break
+    return result
+
+def lcm_many(values):
+    """LCM of a list, array.array or NumPy array; stops early once it hits 0"""
+    np = numpy_for(values)
+    if np is not None:
+        # Reduce with Python ints so large results cannot overflow int64
+        values = values.ravel().tolist()
+    result = 1
+    for chunk in _chunks(values):
+        result = math.lcm(result, *chunk)
+        if result == 0:
+            break
+    return result
+
+def _pairwise(func, numpy_func_name, a, b):
+    """Apply func elementwise to two equal-length sequences"""
+    if len(a) != len(b):
+        raise ValueError("Arrays must have the same length")
+    np = numpy_for(a) or numpy_for(b)
+    if np is not None:
+        return getattr(np, numpy_func_name)(a, b)
+    result = map(func, a, b)
+    if isinstance(a, array):
+        return array(a.typecode, result)
+    return list(result)
+
+def gcd_pairwise(a, b):
+    """Elementwise GCD of two equal-length lists, array.arrays or NumPy arrays"""
+    return _pairwise(math.gcd, 'gcd', a, b)
+
+def lcm_pairwise(a, b):
+    """Elementwise LCM of two equal-length lists, array.arrays or NumPy arrays
+
+    The LCM can outgrow the inputs' element type, so it is computed with
+    Python ints and only narrowed back to the input array type (or dtype)
+    when every result fits; otherwise a list (or object-dtype array) is
+    returned.
+    """
+    if len(a) != len(b):
+        raise ValueError("Arrays must have the same length")
+    np = numpy_for(a) or numpy_for(b)
+    if np is not None:
+        a, b = np.asarray(a), np.asarray(b)
+        dtype = np.result_type(a, b)
+        results = np.frompyfunc(math.lcm, 2, 1)(a.astype(object), b.astype(object))
+        if dtype.kind in 'iu':
+            info = np.iinfo(dtype)
+            if not results.size or info.min <= results.min() and results.max() <= info.max:
+                return results.astype(dtype)
+        return results
+    results = list(map(math.lcm, a, b))
+    if isinstance(a, array):
+        try:
+            return array(a.typecode, results)
+        except OverflowError:
+            pass
+    return results
+
+# Heavy lookup tables are built on first access (PEP 562)
+__getattr__ = lazy_attributes(
+    globals(),
+    BASE_PRIMES=_get_base_primes,
+)
+
 # This will only run if the module is executed directly
 if __name__ == "__main__":
     print("Math Utils Module Test")
@@ -0,0 +1,104 @@
+"""
+Parallel Primes: Multi-core prime range generation
+Splits the range up to a limit into segments and sieves them in a process
+pool with math_utils' segmented sieve. The base primes are sent to each
+worker once, and segment results come back in order, either as a stream of
+primes or reduced to counts or sums inside the workers.
+"""
+
+import math
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+
+import math_utils
+
+# Odd numbers per task; large enough to amortize inter-process overhead
+PARALLEL_SEGMENT_SIZE = 1 << 20
+
+# Base primes of the current worker process, set by _init_worker
+_worker_base_primes = None
+
+def _init_worker(base_primes):
+    """Receive the shared base-prime list once per worker process"""
+    global _worker_base_primes
+    _worker_base_primes = base_primes
+
+def _sieve_task(low, high, mode, base_primes=None):
+    """Sieve the odd numbers in [low, high) and reduce them according to mode"""
+    if base_primes is None:
+        base_primes = _worker_base_primes
+    segment = math_utils._sieve_segment(low, high, base_primes)
+    if mode == 'count':
+        return segment.count(1)
+    primes = compress(range(low, high, 2), segment)
+    if mode == 'sum':
+        return sum(primes)
+    return array('Q', primes)
+
+def _segment_results(limit, mode, workers, segment_size):
+    """Yield the per-segment results for the odd numbers in [3, limit], in order"""
+    if segment_size < 1:
+        raise ValueError("Segment size must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Worker count must be at least 1")
+    if limit < 3:
+        return
+    base_primes = array('Q', math_utils._odd_base_primes(math.isqrt(limit)))
+    span = 2 * segment_size
+    bounds = ((low, min(low + span, limit + 1)) for low in range(3, limit + 1, span))
+
+    if workers == 1:
+        for low, high in bounds:
+            yield _sieve_task(low, high, mode, base_primes)
+        return
+
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(base_primes,))
+    try:
+        # Keep a bounded window of segments in flight so memory stays flat
+        pending = deque()
+        for low, high in bounds:
+            pending.append(pool.submit(_sieve_task, low, high, mode))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def iter_primes_parallel(limit, workers=None, segment_size=PARALLEL_SEGMENT_SIZE):
+    """Lazily yield the primes up to limit, in order, sieved by a process pool"""
+    if limit >= 2:
+        yield 2
+    for primes in _segment_results(limit, 'primes', workers, segment_size):
+        yield from primes
+
+def count_primes_parallel(limit, workers=None, segment_size=PARALLEL_SEGMENT_SIZE):
+    """Count the primes up to limit without sending them between processes"""
+    first = 1 if limit >= 2 else 0
+    return first + sum(_segment_results(limit, 'count', workers, segment_size))
+
+def sum_primes_parallel(limit, workers=None, segment_size=PARALLEL_SEGMENT_SIZE):
+    """Sum the primes up to limit without sending them between processes"""
+    first = 2 if limit >= 2 else 0
+    return first + sum(_segment_results(limit, 'sum', workers, segment_size))
+
+def main():
+    print("=== Parallel Prime Generation ===\n")
+
+    limit = 10 ** 7
+    workers = os.cpu_count() or 1
+    print(f"Sieving up to {limit:,} with {workers} worker process(es)")
+    print(f"  Prime count: {count_primes_parallel(limit):,}")
+    print(f"  Prime sum: {sum_primes_parallel(limit):,}")
+    last = None
+    for last in iter_primes_parallel(limit):
+        pass
+    print(f"  Largest prime: {last}")
+
+if __name__ == "__main__":
+    main()
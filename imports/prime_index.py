@@ -0,0 +1,190 @@
+"""
+Prime Index: Persistent memory-mapped prime bitmap
+Builds an on-disk bitmap of the odd primes up to a limit, plus a block-level
+rank table, and opens it with mmap so many processes share one copy through
+the page cache. Queries outside the indexed range fall back to math_utils.
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+
+import math_utils
+
+# File layout: header, bitmap (bit i <=> 2*i + 1 is prime), rank table
+_MAGIC = b"PRIMEIDX"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")  # magic, version, block bytes, limit, blocks, odd primes
+# Bitmap bytes covered by one rank entry (512 odd numbers)
+BLOCK_BYTES = 64
+# Odd numbers sieved per build step; a multiple of 8 * BLOCK_BYTES
+_BUILD_SEGMENT = 1 << 18
+
+# Number of set bits in every byte value
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+# Bit positions set in every byte value, lowest first
+_SET_BITS = tuple(tuple(b for b in range(8) if i >> b & 1) for i in range(256))
+# Maps sieve flag bytes 0/1 to ASCII "0"/"1" so int(..., 2) can pack them
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+def _pack_flags(flags):
+    """Pack a bytearray of 0/1 flags (length divisible by 8) into LSB-first bits"""
+    if not flags:
+        return b""
+    bits = flags.translate(_FLAG_DIGITS)[::-1]
+    return int(bits, 2).to_bytes(len(flags) // 8, "little")
+
+def build_prime_index(path, limit):
+    """Sieve the primes up to limit and write them as a prime index file"""
+    if limit < 2:
+        raise ValueError("Index limit must be at least 2")
+    odd_count = (limit - 1) // 2 + 1  # odd numbers 1, 3, ..., <= limit
+    bitmap_bytes = -(-odd_count // (8 * BLOCK_BYTES)) * BLOCK_BYTES
+    blocks = bitmap_bytes // BLOCK_BYTES
+    base_primes = math_utils._odd_base_primes(math.isqrt(limit))
+
+    # ranks[b] = odd primes before block b; the last entry is the total
+    ranks = array("Q", [0])
+    total = 0
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for first in range(0, blocks * BLOCK_BYTES * 8, _BUILD_SEGMENT):
+            last = min(first + _BUILD_SEGMENT, blocks * BLOCK_BYTES * 8)
+            # Sieve the real odd numbers, then pad with zeros past the limit
+            low, high = 2 * first + 1, min(2 * last + 1, limit + 1)
+            flags = math_utils._sieve_segment(low, high, base_primes) if low < high else bytearray()
+            if first == 0:
+                flags[0] = 0  # 1 is not prime
+            flags.extend(bytes(last - first - len(flags)))
+            packed = _pack_flags(flags)
+            for start in range(0, len(packed), BLOCK_BYTES):
+                total += int.from_bytes(packed[start:start + BLOCK_BYTES], "little").bit_count()
+                ranks.append(total)
+            f.write(packed)
+        if sys.byteorder != "little":
+            ranks.byteswap()
+        ranks.tofile(f)
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, BLOCK_BYTES, limit, blocks, total))
+    os.replace(temp_path, path)
+    return path
+
+class PrimeIndex:
+    """Read-only, memory-mapped view of a prime index file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, block_bytes, limit, blocks, odd_primes = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a prime index file")
+        self.limit = limit
+        self._block_bytes = block_bytes
+        self._odd_primes = odd_primes
+        bitmap_end = _HEADER.size + blocks * block_bytes
+        view = memoryview(self._mmap)
+        self._bitmap = view[_HEADER.size:bitmap_end]
+        self._ranks = view[bitmap_end:bitmap_end + 8 * (blocks + 1)].cast("Q")
+        if sys.byteorder != "little":
+            self._ranks = array("Q", self._ranks)
+            self._ranks.byteswap()
+
+    def close(self):
+        """Release the memory map"""
+        self._bitmap.release()
+        if isinstance(self._ranks, memoryview):
+            self._ranks.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _odd_primes_through(self, bit):
+        """Count the set bits 0..bit of the bitmap using the rank table"""
+        block, offset = divmod(bit, 8 * self._block_bytes)
+        start = block * self._block_bytes
+        byte, shift = divmod(offset, 8)
+        partial = int.from_bytes(self._bitmap[start:start + byte + 1], "little")
+        return self._ranks[block] + (partial & ((1 << (8 * byte + shift + 1)) - 1)).bit_count()
+
+    def is_prime(self, n):
+        """Check if n is prime, by bitmap lookup when n is indexed"""
+        if n > self.limit:
+            return math_utils.is_prime(n)
+        if n < 2 or n % 2 == 0:
+            return n == 2
+        bit = n // 2
+        return bool(self._bitmap[bit >> 3] >> (bit & 7) & 1)
+
+    def prime_count(self, x):
+        """Count the primes <= x"""
+        if x < 2:
+            return 0
+        if x > self.limit:
+            beyond = sum(1 for _ in math_utils.iter_primes_between(self.limit + 1, x))
+            return 1 + self._odd_primes + beyond
+        return 1 + self._odd_primes_through((x - 1) // 2)
+
+    def nth_prime(self, k):
+        """Return the kth prime (nth_prime(1) == 2)"""
+        if k < 1:
+            raise ValueError("Prime index k must be at least 1")
+        if k == 1:
+            return 2
+        target = k - 1  # position among the odd primes
+        if target > self._odd_primes:
+            return self._nth_prime_beyond(target - self._odd_primes)
+        block = bisect_left(self._ranks, target) - 1
+        remaining = target - self._ranks[block]
+        start = block * self._block_bytes
+        for position in range(start, start + self._block_bytes):
+            byte = self._bitmap[position]
+            count = _POPCOUNT[byte]
+            if remaining <= count:
+                return 2 * (8 * position + _SET_BITS[byte][remaining - 1]) + 1
+            remaining -= count
+        raise ValueError(f"{self.path} has an inconsistent rank table")
+
+    def _nth_prime_beyond(self, k):
+        """Sieve past the indexed range for the kth prime above the limit"""
+        low = self.limit + 1
+        while True:
+            # Window sized from the prime-number theorem; repeat if it falls short
+            span = int(k * (math.log(k + 2) + math.log(math.log(k + 2) + 1))) + 6 * k + 64
+            for p in math_utils.iter_primes_between(low, low + span):
+                k -= 1
+                if k == 0:
+                    return p
+            low += span + 1
+
+def open_prime_index(path, limit):
+    """Open the prime index at path, building it first if it does not exist"""
+    if not os.path.exists(path):
+        build_prime_index(path, limit)
+    return PrimeIndex(path)
+
+def main():
+    print("=== Prime Index Demo ===\n")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "primes.idx")
+        with open_prime_index(path, 1_000_000) as index:
+            print(f"Indexed primes up to {index.limit:,} ({os.path.getsize(path):,} bytes)")
+            print(f"  Is 999983 prime? {index.is_prime(999983)}")
+            print(f"  Primes below 1,000,000: {index.prime_count(999_999):,}")
+            print(f"  The 10,000th prime: {index.nth_prime(10_000)}")
+            print(f"  Primes up to 1,100,000 (partly computed): {index.prime_count(1_100_000):,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+Profiling Registry: Low-overhead call timing
+Decorated functions record perf_counter_ns() durations into a fixed-size,
+HDR-style log-linear histogram per function (about 3% relative precision),
+optionally sampling only one call in N. snapshot() reports counts, totals
+and p50/p95/p99; to_json() exports the same data. Histograms are named
+"module.qualname" unless a name is given.
+
+measure_overhead() reports the real per-call cost. A fully timed call costs
+two perf_counter_ns() reads plus the wrapper call, so it depends on the
+clock source: about 0.7-1.2 us on slow virtualized clocks, where a single
+read is ~100 ns. Use sample_every to stay well under 1 us on hot paths.
+
+track() is the heavier, kind-aware variant: it also handles coroutines,
+generators and async generators, and records on-CPU time (thread_time)
+next to wall time so blocking I/O can be told apart from computation.
+"""
+
+import inspect
+import json
+import time
+from functools import wraps
+
+# Each power of two is split into 2**_SUB_BITS linear sub-buckets
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS
+# Durations below this many ns get one exact bucket each
+_EXACT_LIMIT = 2 * _SUB_COUNT
+# Enough buckets for any duration below 2**63 ns
+_BUCKETS = (63 - _SUB_BITS) * _SUB_COUNT + _EXACT_LIMIT
+
+def bucket_index(ns):
+    """Histogram bucket for a duration in nanoseconds"""
+    if ns < _EXACT_LIMIT:
+        return ns if ns > 0 else 0
+    shift = ns.bit_length() - _SUB_BITS - 1
+    return shift * _SUB_COUNT + (ns >> shift)
+
+def bucket_value(index):
+    """Smallest duration (ns) that falls into a bucket"""
+    if index < _EXACT_LIMIT:
+        return index
+    shift = index // _SUB_COUNT - 1
+    return (index - shift * _SUB_COUNT) << shift
+
+class Histogram:
+    """Fixed-size log-linear histogram of nanosecond durations"""
+
+    __slots__ = ('counts', 'total_ns')
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.clear()
+
+    @property
+    def samples(self):
+        """Number of recorded durations (derived, so recording skips a counter)"""
+        return sum(self.counts)
+
+    def clear(self):
+        """Drop all samples, keeping the same counts list"""
+        self.counts[:] = [0] * _BUCKETS
+        self.total_ns = 0
+
+    def record(self, ns):
+        """Add one duration"""
+        self.counts[bucket_index(ns)] += 1
+        self.total_ns += ns
+
+    def percentile(self, fraction, samples=None):
+        """Approximate duration (ns) below which fraction of the samples fall"""
+        if samples is None:
+            samples = self.samples
+        if not samples:
+            return None
+        rank = max(1, round(fraction * samples))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                # Middle of the bucket halves the worst-case error
+                return (bucket_value(index) + bucket_value(index + 1) - 1) // 2
+        return None
+
+    def summary(self):
+        """Counts, totals and percentiles as a plain dict (bucket precision)"""
+        samples = self.samples
+        return {
+            'samples': samples,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / samples if samples else None,
+            'min_ns': self.percentile(0.0, samples),
+            'p50_ns': self.percentile(0.50, samples),
+            'p95_ns': self.percentile(0.95, samples),
+            'p99_ns': self.percentile(0.99, samples),
+            'max_ns': self.percentile(1.0, samples),
+        }
+
+def qualified_name(func):
+    """Default histogram name of a function: "module.qualname" """
+    return f"{func.__module__}.{func.__qualname__}"
+
+class ProfileRegistry:
+    """Per-function histograms filled by the profile() decorator"""
+
+    def __init__(self):
+        # name -> (Histogram, sample_every)
+        self._entries = {}
+
+    def histogram(self, name, sample_every=1):
+        """Histogram for name, created on first use
+
+        Raises ValueError if name is already registered with a different
+        sample_every, since the two would report inconsistent call counts.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._entries[name] = (Histogram(), sample_every)
+        elif entry[1] != sample_every:
+            raise ValueError(f"{name!r} is already profiled with sample_every={entry[1]}")
+        return entry[0]
+
+    def profile(self, func=None, *, name=None, sample_every=1):
+        """Decorator recording the duration of every (or every Nth) call"""
+        if func is None:
+            return lambda f: self.profile(f, name=name, sample_every=sample_every)
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        histogram = self.histogram(name or qualified_name(func), sample_every)
+        counts = histogram.counts
+        clock = time.perf_counter_ns
+        sub_bits, sub_count, exact_limit = _SUB_BITS, _SUB_COUNT, _EXACT_LIMIT
+
+        # bucket_index() and record() are inlined below to keep overhead small
+        if sample_every == 1:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = clock()
+                result = func(*args, **kwargs)
+                ns = clock() - start
+                if ns < exact_limit:
+                    counts[ns] += 1
+                else:
+                    shift = ns.bit_length() - sub_bits - 1
+                    counts[shift * sub_count + (ns >> shift)] += 1
+                histogram.total_ns += ns
+                return result
+        else:
+            skip = 0
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                nonlocal skip
+                if skip:
+                    skip -= 1
+                    return func(*args, **kwargs)
+                skip = sample_every - 1
+                start = clock()
+                result = func(*args, **kwargs)
+                ns = clock() - start
+                if ns < exact_limit:
+                    counts[ns] += 1
+                else:
+                    shift = ns.bit_length() - sub_bits - 1
+                    counts[shift * sub_count + (ns >> shift)] += 1
+                histogram.total_ns += ns
+                return result
+        return wrapper
+
+    def track(self, func=None, *, name=None):
+        """Decorator recording wall and on-CPU time, aware of the function kind
+
+        <name> gets wall time and <name>.cpu the thread CPU time of:
+          - each call, for plain functions;
+          - each awaited call, for coroutine functions (CPU time counts
+            only the steps where the coroutine itself runs);
+          - each produced item, for generators and async generators.
+        """
+        if func is None:
+            return lambda f: self.track(f, name=name)
+        name = name or qualified_name(func)
+        wall = self.histogram(name).record
+        cpu = self.histogram(f"{name}.cpu").record
+
+        if inspect.isasyncgenfunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                agen = func(*args, **kwargs)
+                value, error = None, None
+                try:
+                    while True:
+                        # Forward asend() values and athrow() errors, like gen.send/gen.throw
+                        step = agen.asend(value) if error is None else agen.athrow(error)
+                        try:
+                            item = await _TimedSteps(step, wall, cpu)
+                        except StopAsyncIteration:
+                            return
+                        try:
+                            value, error = (yield item), None
+                        except GeneratorExit:
+                            raise
+                        except BaseException as e:
+                            value, error = None, e
+                finally:
+                    await agen.aclose()
+        elif inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await _TimedSteps(func(*args, **kwargs), wall, cpu)
+        elif inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return (yield from _timed_generator(func(*args, **kwargs), wall, cpu))
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    cpu(time.thread_time_ns() - cpu_start)
+                    wall(time.perf_counter_ns() - start)
+        return wrapper
+
+    def snapshot(self):
+        """Summaries for every profiled function, keyed by name"""
+        result = {}
+        for name, (histogram, sample_every) in self._entries.items():
+            summary = histogram.summary()
+            summary['sample_every'] = sample_every
+            summary['estimated_calls'] = summary['samples'] * sample_every
+            result[name] = summary
+        return result
+
+    def to_json(self, path=None):
+        """Export snapshot() as JSON, to path if given; returns the JSON text"""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def reset(self):
+        """Forget all recorded samples (decorated functions keep working)"""
+        for histogram, _ in self._entries.values():
+            histogram.clear()
+
+class _TimedSteps:
+    """Awaitable that drives a coroutine step by step, timing it
+
+    Wall time runs from the first step to completion, awaits included;
+    CPU time only adds up the steps in which the coroutine itself runs.
+    An async generator step that ends in StopAsyncIteration produced no
+    item, so it is not recorded.
+    """
+
+    __slots__ = ('coro', 'wall', 'cpu')
+
+    def __init__(self, coro, wall, cpu):
+        self.coro = coro
+        self.wall = wall
+        self.cpu = cpu
+
+    def __await__(self):
+        coro = self.coro
+        start = time.perf_counter_ns()
+        cpu_total = 0
+        value, error = None, None
+        produced = True
+        try:
+            while True:
+                cpu_start = time.thread_time_ns()
+                try:
+                    if error is None:
+                        future = coro.send(value)
+                    else:
+                        future = coro.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    cpu_total += time.thread_time_ns() - cpu_start
+                try:
+                    value, error = (yield future), None
+                except BaseException as e:
+                    value, error = None, e
+        except StopAsyncIteration:
+            produced = False
+            raise
+        finally:
+            if produced:
+                self.cpu(cpu_total)
+                self.wall(time.perf_counter_ns() - start)
+
+def _timed_generator(gen, wall, cpu):
+    """Re-yield gen's items, recording how long each one took to produce"""
+    value, error = None, None
+    while True:
+        start, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+        try:
+            if error is None:
+                item = gen.send(value)
+            else:
+                item = gen.throw(error)
+        except StopIteration as stop:
+            # The step that finishes gen yields no item
+            return stop.value
+        cpu(time.thread_time_ns() - cpu_start)
+        wall(time.perf_counter_ns() - start)
+        try:
+            value, error = (yield item), None
+        except GeneratorExit:
+            gen.close()
+            raise
+        except BaseException as e:
+            value, error = None, e
+
+def measure_overhead(registry=None, calls=100000, sample_every=1):
+    """Average nanoseconds a profiled call costs over a plain call"""
+    registry = registry or ProfileRegistry()
+
+    def noop():
+        return None
+
+    profiled = registry.profile(noop, name=f'__overhead_{sample_every}__',
+                                sample_every=sample_every)
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(calls):
+        noop()
+    plain = clock() - start
+    start = clock()
+    for _ in range(calls):
+        profiled()
+    wrapped = clock() - start
+    return max(0, wrapped - plain) / calls
+
+# Shared registry used by the module-level decorators
+default_registry = ProfileRegistry()
+profile = default_registry.profile
+track = default_registry.track
@@ -5,6 +5,9 @@ This program demonstrates importing the entire math module and using its functio
 """
 
 import math
+from array import array
+
+from math_utils import numpy_for
 
 def calculate_circle_properties(radius):
     """Calculate area and circumference of a circle"""
@@ -24,6 +27,55 @@ def calculate_triangle_properties(a, b, c):
     else:
         return None
 
+def calculate_circle_properties_many(radii):
+    """Areas and circumferences for a list, array.array or NumPy array of radii"""
+    np = numpy_for(radii)
+    if np is not None:
+        radii = np.asarray(radii, dtype=float)
+        return math.pi * (radii * radii), (2 * math.pi) * radii
+    areas = [math.pi * (r * r) for r in radii]
+    circumferences = [2 * math.pi * r for r in radii]
+    if isinstance(radii, array):
+        return array('d', areas), array('d', circumferences)
+    return areas, circumferences
+
+def _stable_heron(a, b, c):
+    """Kahan's Heron formula for sorted sides a >= b >= c; accurate for needles"""
+    return 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+
+def calculate_triangle_properties_many(sides):
+    """Areas and a validity mask for many triangles
+
+    sides is a NumPy array of shape (n, 3), a sequence of (a, b, c) triples,
+    or a flat array.array of 3n side lengths. Results are NumPy arrays for
+    NumPy input, otherwise an array('d') of areas and a bytearray mask.
+    Invalid triangles get a nan area and a 0 in the mask instead of None.
+    """
+    np = numpy_for(sides)
+    if np is not None:
+        ordered = np.sort(np.asarray(sides, dtype=float).reshape(-1, 3), axis=1)
+        c, b, a = ordered[:, 0], ordered[:, 1], ordered[:, 2]
+        valid = b + c > a
+        with np.errstate(invalid='ignore'):
+            areas = 0.25 * np.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+        areas[~valid] = np.nan
+        return areas, valid
+    if isinstance(sides, array):
+        triples = zip(sides[0::3], sides[1::3], sides[2::3])
+    else:
+        triples = sides
+    areas = array('d')
+    valid = bytearray()
+    for triple in triples:
+        c, b, a = sorted(triple)
+        if b + c > a:
+            areas.append(_stable_heron(a, b, c))
+            valid.append(1)
+        else:
+            areas.append(math.nan)
+            valid.append(0)
+    return areas, valid
+
 def main():
     print("=== Math Calculator ===\n")
 
@@ -40,6 +92,14 @@ def main():
     if triangle_area:
         print(f"  Area: {triangle_area:.2f}")
 
+    # Many shapes at once
+    print("\nBatch Calculations:")
+    areas, circumferences = calculate_circle_properties_many(array('d', [1, 2.5, 10]))
+    print(f"  Circle areas: {[round(x, 2) for x in areas]}")
+    triangle_areas, valid = calculate_triangle_properties_many([(3, 4, 5), (1, 2, 10), (1e8, 1e8, 1e-3)])
+    print(f"  Triangle areas: {[round(x, 4) for x in triangle_areas]}")
+    print(f"  Valid triangles: {list(valid)}")
+
     # Other math operations
     print("\nOther Math Operations:")
     print(f"  Ceiling of 4.3: {math.ceil(4.3)}")
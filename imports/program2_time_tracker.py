@@ -5,17 +5,25 @@ This program demonstrates selective imports and aliasing.
 """
 
 from datetime import datetime, timedelta, date
+from array import array
+from itertools import compress
+import asyncio
+import calendar
 import time as t
+from profiling_registry import default_registry as profiler, qualified_name
+from reminder_scheduler import daily, iter_occurrences
+from timestamp_format import compile_format
+from math_utils import numpy_for
 
 def track_execution_time(func):
-    """Decorator to track function execution time"""
-    def wrapper(*args, **kwargs):
-        start = t.time()
-        result = func(*args, **kwargs)
-        end = t.time()
-        print(f"  Execution time: {end - start:.4f} seconds")
-        return result
-    return wrapper
+    """Decorator to track function execution time
+
+    Durations go into the shared profiling registry instead of being printed;
+    read them back with profiler.snapshot() or profiler.to_json().
+    Coroutines are timed across their awaits and generators per yielded
+    item; "<name>.cpu" holds the on-CPU part of the same measurements.
+    """
+    return profiler.track(func)
 
 @track_execution_time
 def simulate_work():
@@ -24,6 +32,19 @@ def simulate_work():
     t.sleep(0.5)  # Sleep for 0.5 seconds
     return "Work completed!"
 
+@track_execution_time
+async def simulate_work_async():
+    """Simulate the same delay without blocking the event loop"""
+    await asyncio.sleep(0.5)
+    return "Async work completed!"
+
+@track_execution_time
+def generate_work_items(count):
+    """Yield squares after a short computation per item"""
+    for i in range(count):
+        sum(range(100000))
+        yield i * i
+
 def calculate_age(birth_year, birth_month, birth_day):
     """Calculate age from birthdate"""
     birthdate = date(birth_year, birth_month, birth_day)
@@ -36,23 +57,96 @@ def calculate_age(birth_year, birth_month, birth_day):
 
     return age, birthdate
 
+# Every valid month*100 + day key; 229 (Feb 29) also needs a leap birth year
+_VALID_DATE_KEYS = frozenset(month * 100 + day
+                             for month in range(1, 13)
+                             for day in range(1, calendar.monthrange(2000, month)[1] + 1))
+
+def _birth_fields_numpy(np, births):
+    """Year, month and day columns of a datetime64 column"""
+    births = births.astype('datetime64[D]')
+    if np.isnat(births).any():
+        row = int(np.argmax(np.isnat(births)))
+        raise ValueError(f"Invalid birth date in row {row}: NaT")
+    month_starts = births.astype('datetime64[M]')
+    years = births.astype('datetime64[Y]').astype(np.int64) + 1970
+    months = month_starts.astype(np.int64) % 12 + 1
+    days = (births - month_starts).astype(np.int64) + 1
+    return years, months, days
+
+def _check_birth_fields_numpy(np, years, months, days):
+    """Raise ValueError for the first row that is not a real date"""
+    month_lengths = np.array([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    bad_month = (months < 1) | (months > 12)
+    limit = month_lengths[np.where(bad_month, 0, months)]
+    bad = bad_month | (days < 1) | (days > limit) | ((months == 2) & (days == 29) & ~leap)
+    if bad.any():
+        row = int(np.argmax(bad))
+        raise ValueError(f"Invalid birth date in row {row}: "
+                         f"{years[row]}-{months[row]}-{days[row]}")
+
+def calculate_ages_many(years, months=None, days=None, reference=None):
+    """Ages of many people on one reference date (default: today)
+
+    Pass columns of birth years, months and days (lists, array.array or
+    NumPy arrays), or a single NumPy datetime64 column as years. Ages come
+    back as an int64 NumPy array for NumPy input, otherwise as array('q').
+    Like calculate_age(), someone born on Feb 29 turns a year older on
+    Mar 1 in non-leap years.
+    """
+    reference = reference or date.today()
+    reference_year = reference.year
+    reference_key = reference.month * 100 + reference.day
+    np = numpy_for(years) or numpy_for(months) or numpy_for(days)
+    if np is not None and months is None and days is None and years.dtype.kind == 'M':
+        years, months, days = _birth_fields_numpy(np, years)
+    elif months is None or days is None:
+        raise TypeError("months and days are required unless years is a datetime64 array")
+    elif np is not None:
+        years, months, days = (np.asarray(column, dtype=np.int64)
+                               for column in (years, months, days))
+        if not years.shape == months.shape == days.shape:
+            raise ValueError("years, months and days must have the same length")
+        _check_birth_fields_numpy(np, years, months, days)
+    if np is not None:
+        keys = months * 100 + days
+        return reference_year - years - (keys > reference_key)
+
+    if not len(years) == len(months) == len(days):
+        raise ValueError("years, months and days must have the same length")
+    # Compare packed month*100 + day keys instead of building date objects
+    keys = [month * 100 + day for month, day in zip(months, days)]
+    key_set = set(keys)
+    if not key_set <= _VALID_DATE_KEYS:
+        row = next(i for i, key in enumerate(keys) if key not in _VALID_DATE_KEYS)
+        raise ValueError(f"Invalid birth date in row {row}: "
+                         f"{years[row]}-{months[row]}-{days[row]}")
+    if 229 in key_set:
+        for year in compress(years, [key == 229 for key in keys]):
+            if not calendar.isleap(year):
+                raise ValueError(f"Invalid birth date: {year}-2-29")
+
+    return array('q', [reference_year - year - (key > reference_key)
+                       for year, key in zip(years, keys)])
+
 def schedule_reminders():
     """Create a schedule of reminders for the week"""
-    now = datetime.now()
-    reminders = []
-
-    for i in range(1, 8):
-        reminder_time = now + timedelta(days=i)
-        reminders.append(reminder_time.strftime("%A, %B %d at %H:%M"))
+    # reminder_scheduler.ReminderScheduler runs the same rules at scale
+    start = datetime.now() + timedelta(days=1)
+    reminder_times = iter_occurrences(start, daily(as_timedelta=True), count=7)
+    return compile_format("%A, %B %d at %H:%M").format_many(reminder_times)
 
-    return reminders
+async def _run_async_work(count):
+    """Run several async jobs concurrently; together they take ~0.5 s"""
+    return await asyncio.gather(*(simulate_work_async() for _ in range(count)))
 
 def main():
     print("=== Time Tracker Application ===\n")
 
     # Current time information
     current_time = datetime.now()
-    print(f"Current Date and Time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Current Date and Time: {compile_format('%Y-%m-%d %H:%M:%S').format(current_time)}")
     print(f"Current Day: {current_time.strftime('%A')}")
     print(f"Current Month: {current_time.strftime('%B')}")
 
@@ -61,6 +155,10 @@ def main():
     age, birthdate = calculate_age(1995, 5, 15)
     print(f"  Birth Date: {birthdate.strftime('%B %d, %Y')}")
     print(f"  Current Age: {age} years")
+    reference = date(2025, 2, 28)
+    ages = calculate_ages_many([1995, 2000, 2004, 2010], [5, 2, 2, 12], [15, 29, 28, 31],
+                               reference=reference)
+    print(f"  Batch ages on {reference}: {list(ages)}")
 
     # Time until next year
     new_year = datetime(datetime.now().year + 1, 1, 1)
@@ -71,6 +169,17 @@ def main():
     print("\nFunction Execution Tracking:")
     result = simulate_work()
     print(f"  Result: {result}")
+    results = asyncio.run(_run_async_work(3))
+    print(f"  Async results: {results}")
+    items = list(generate_work_items(5))
+    print(f"  Generated items: {items}")
+    stats = profiler.snapshot()
+    for func in (simulate_work, simulate_work_async, generate_work_items):
+        name = qualified_name(func)
+        wall, cpu = stats[name], stats[f"{name}.cpu"]
+        print(f"  {func.__name__}: {wall['mean_ns'] / 1e9:.4f} s wall, "
+              f"{cpu['mean_ns'] / 1e9:.4f} s CPU per "
+              f"{'item' if func is generate_work_items else 'call'}")
 
     # Schedule reminders
     print("\nWeekly Reminder Schedule:")
@@ -119,9 +119,7 @@ def demonstrate_practical_usage():
     print(f"Numbers: {numbers}")
 
     # Find GCD of all numbers
-    result = numbers[0]
-    for num in numbers[1:]:
-        result = math_utils.gcd(result, num)
+    result = math_utils.gcd_many(numbers)
     print(f"GCD of all numbers: {result}")
 
 def main():
@@ -4,19 +4,31 @@ Practice: import json and working with JSON data
 This program demonstrates JSON handling for data persistence and API interactions.
 """
 
-import json
-from json import JSONEncoder, JSONDecoder
-from datetime import datetime, date
-from typing import Dict, List, Any
+from datetime import datetime, date, timedelta
 import os
 
-# Custom JSON Encoder for handling special types
-class CustomJSONEncoder(JSONEncoder):
-    """Custom JSON encoder to handle datetime objects"""
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        return super().default(obj)
+from iso_timestamps import indexes_between, parse_many_epoch_us
+from lazy_imports import lazy_attributes, lazy_import
+
+# json loads on first use, so runs that never touch JSON skip it
+json = lazy_import("json")
+
+def encode_special_types(obj):
+    """json default= hook that handles datetime objects"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _build_custom_json_encoder():
+    # Custom JSON Encoder for handling special types
+    class CustomJSONEncoder(json.JSONEncoder):
+        """Custom JSON encoder to handle datetime objects"""
+        def default(self, obj):
+            return encode_special_types(obj)
+    return CustomJSONEncoder
+
+# CustomJSONEncoder subclasses json.JSONEncoder, so it is built on first access
+__getattr__ = lazy_attributes(globals(), CustomJSONEncoder=_build_custom_json_encoder)
 
 class StudentDatabase:
     """A simple student database using JSON for storage"""
@@ -24,10 +36,13 @@ class StudentDatabase:
     def __init__(self, filename="students.json"):
         self.filename = filename
         self.students = []
+        # field -> (student positions, epoch-microsecond column) for range queries
+        self._time_columns = {}
         self.load_data()
 
     def load_data(self):
         """Load students from JSON file"""
+        self._time_columns.clear()
         if os.path.exists(self.filename):
             try:
                 with open(self.filename, 'r') as f:
@@ -42,14 +57,16 @@ class StudentDatabase:
 
     def save_data(self):
         """Save students to JSON file"""
+        # Every change goes through here, so drop the parsed timestamp columns
+        self._time_columns.clear()
         try:
             with open(self.filename, 'w') as f:
-                json.dump(self.students, f, indent=4, cls=CustomJSONEncoder)
+                json.dump(self.students, f, indent=4, default=encode_special_types)
             print(f"Saved {len(self.students)} students to {self.filename}")
         except Exception as e:
             print(f"Error saving data: {e}")
 
-    def add_student(self, student: Dict):
+    def add_student(self, student: dict):
         """Add a new student"""
         student['id'] = len(self.students) + 1
         student['created_at'] = datetime.now().isoformat()
@@ -57,18 +74,33 @@ class StudentDatabase:
         self.save_data()
         return student
 
-    def get_all_students(self) -> List[Dict]:
+    def get_all_students(self) -> list[dict]:
         """Get all students"""
         return self.students
 
-    def find_student(self, student_id: int) -> Dict:
+    def find_student(self, student_id: int) -> dict:
         """Find a student by ID"""
         for student in self.students:
             if student.get('id') == student_id:
                 return student
         return None
 
-    def update_student(self, student_id: int, updates: Dict) -> bool:
+    def find_students_between(self, start=None, end=None, field='created_at') -> list[dict]:
+        """Students whose timestamp field lies in [start, end)
+
+        start and end may be datetimes, dates or ISO strings; None is open.
+        The field is parsed once into epoch microseconds and reused until
+        the data changes.
+        """
+        entry = self._time_columns.get(field)
+        if entry is None:
+            positions = [i for i, student in enumerate(self.students) if student.get(field)]
+            column = parse_many_epoch_us(self.students[i][field] for i in positions)
+            entry = self._time_columns[field] = (positions, column)
+        positions, column = entry
+        return [self.students[positions[i]] for i in indexes_between(column, start, end)]
+
+    def update_student(self, student_id: int, updates: dict) -> bool:
         """Update a student's information"""
         for i, student in enumerate(self.students):
             if student.get('id') == student_id:
@@ -192,7 +224,7 @@ def nested_json_handling():
     }
 
     # Pretty print with custom encoder
-    json_output = json.dumps(company_data, indent=2, cls=CustomJSONEncoder)
+    json_output = json.dumps(company_data, indent=2, default=encode_special_types)
     print("Complex Nested Structure:")
     print(json_output[:300] + "...\n")  # Show first 300 chars
 
@@ -235,11 +267,16 @@ def demonstrate_student_database():
         db.update_student(first_student_id, {"gpa": 3.95})
         print(f"\nUpdated student ID {first_student_id}'s GPA to 3.95")
 
+    # Time-range query on the stored created_at strings
+    today = datetime.now().date()
+    created_today = db.find_students_between(today, today + timedelta(days=1))
+    print(f"\nStudents created today: {len(created_today)}")
+
     # Find a specific student
     if len(all_students) > 1:
         second_student = db.find_student(all_students[1]['id'])
         if second_student:
-            print(f"\nFound student: {json.dumps(second_student, indent=2, cls=CustomJSONEncoder)}")
+            print(f"\nFound student: {json.dumps(second_student, indent=2, default=encode_special_types)}")
 
     # Clean up
     if os.path.exists("demo_students.json"):
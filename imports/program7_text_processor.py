@@ -5,12 +5,15 @@ This program demonstrates various import patterns for text processing.
 """
 
 # Different import styles for different modules
-import string  # Full module import
-import re as regex  # Module with alias
 from collections import Counter, defaultdict, namedtuple  # Specific imports
-from textwrap import wrap, dedent, fill  # Multiple specific imports
-from itertools import chain, combinations  # Utility functions
-import unicodedata  # Unicode handling
+from lazy_imports import lazy_import
+
+# Lazy imports: each module loads on first use, so a run only pays for
+# the demos it actually calls
+string = lazy_import("string")  # Full module import
+regex = lazy_import("re")  # Module with alias
+textwrap = lazy_import("textwrap")  # Text wrapping helpers
+unicodedata = lazy_import("unicodedata")  # Unicode handling
 
 # Create a named tuple for structured data
 TextStats = namedtuple('TextStats', ['words', 'sentences', 'paragraphs', 'avg_word_length'])
@@ -183,19 +186,19 @@ def demonstrate_text_wrapping():
     """
 
     # Clean up the text
-    cleaned = dedent(long_text).strip()
+    cleaned = textwrap.dedent(long_text).strip()
 
     # Wrap text to different widths
     print("Original Text (cleaned):")
     print(cleaned)
 
     print("\nWrapped to 40 characters:")
-    wrapped_40 = wrap(cleaned, width=40)
+    wrapped_40 = textwrap.wrap(cleaned, width=40)
     for line in wrapped_40[:3]:  # Show first 3 lines
         print(f"  {line}")
 
     print("\nFilled with 50 character width:")
-    filled_50 = fill(cleaned, width=50)
+    filled_50 = textwrap.fill(cleaned, width=50)
     print(filled_50[:150] + "...")
 
 def demonstrate_unicode_handling():
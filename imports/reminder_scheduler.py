@@ -0,0 +1,292 @@
+"""
+Reminder Scheduler: Recurring reminders at scale
+Grown out of program2_time_tracker.schedule_reminders(): instead of a list of
+formatted dates, each reminder holds a recurrence rule whose occurrences are
+generated lazily. Only the next occurrence of every reminder sits in a heap,
+so memory grows with the number of reminders, not with their occurrences.
+Cancel and reschedule are O(log n): replaced heap entries are left in place
+and skipped when they reach the top. run_scheduler() is an asyncio driver
+that fires due reminders in batches.
+
+Times are either epoch seconds with float intervals (fastest) or datetimes
+with timedelta intervals; one scheduler should stick to one of the two.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import time
+from datetime import datetime, timedelta
+
+DAY = 86400.0
+DEFAULT_BATCH_SIZE = 1000
+# Rebuild the heap once this many entries (and over half of it) are stale
+_COMPACT_MIN = 1024
+
+def every_n_days(n, as_timedelta=False):
+    """Interval of a reminder repeating every n days"""
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    return timedelta(days=n) if as_timedelta else n * DAY
+
+def daily(as_timedelta=False):
+    """Interval of a daily reminder"""
+    return every_n_days(1, as_timedelta)
+
+def weekly(as_timedelta=False):
+    """Interval of a weekly reminder"""
+    return every_n_days(7, as_timedelta)
+
+def iter_occurrences(start, interval=None, count=None, until=None):
+    """Lazily yield start, start + interval, ... (only start if interval is None)"""
+    if interval is None:
+        count = 1
+    for k in itertools.count() if count is None else range(count):
+        # start + k * interval avoids drift from repeated float additions
+        when = start if k == 0 else start + k * interval
+        if until is not None and when > until:
+            return
+        yield when
+
+class Reminder:
+    """One scheduled reminder and its remaining occurrences"""
+
+    __slots__ = ('id', 'message', 'when', 'rule', 'occurrences', 'version')
+
+    def __init__(self, reminder_id, message):
+        self.id = reminder_id
+        self.message = message
+        self.when = None
+        # (start, interval, count, until); the generator over it is only
+        # created once the first occurrence has fired
+        self.rule = None
+        self.occurrences = None
+        self.version = 0
+
+    def set_rule(self, start, interval=None, count=None, until=None):
+        """Start over with a new recurrence rule; False if it has no occurrence"""
+        if (count is not None and count < 1) or (until is not None and start > until):
+            return False
+        self.when = start
+        self.rule = (start, interval, count, until)
+        self.occurrences = None
+        return True
+
+    def next_occurrence(self):
+        """Move to the following occurrence; False when there is none"""
+        if self.occurrences is None:
+            self.occurrences = itertools.islice(iter_occurrences(*self.rule), 1, None)
+        self.when = next(self.occurrences, None)
+        return self.when is not None
+
+    def __repr__(self):
+        return f"Reminder({self.id}, {self.message!r}, when={self.when!r})"
+
+class ReminderScheduler:
+    """Heap of the next occurrence of every active reminder"""
+
+    def __init__(self):
+        # (when, sequence, version, reminder); sequence keeps ties in FIFO order
+        self._heap = []
+        self._reminders = {}
+        self._ids = itertools.count(1)
+        self._sequence = itertools.count()
+        self._stale = 0
+        # asyncio.Event of a running driver, set whenever the schedule changes
+        self._wakeup = None
+
+    def __len__(self):
+        return len(self._reminders)
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self._reminders
+
+    def get(self, reminder_id):
+        """The Reminder with this id, or None"""
+        return self._reminders.get(reminder_id)
+
+    def schedule(self, message, start, interval=None, count=None, until=None):
+        """Add a reminder; returns its id"""
+        reminder = self._new_reminder(message, start, interval, count, until)
+        if reminder is not None:
+            self._push(reminder)
+            self._notify()
+            return reminder.id
+        return None
+
+    def schedule_many(self, items):
+        """Add (message, start[, interval[, count]]) tuples in one O(n) heapify"""
+        ids = []
+        heap = self._heap
+        sequence = self._sequence
+        for item in items:
+            reminder = self._new_reminder(*item)
+            if reminder is not None:
+                heap.append((reminder.when, next(sequence), reminder.version, reminder))
+                ids.append(reminder.id)
+        heapq.heapify(heap)
+        self._notify()
+        return ids
+
+    def cancel(self, reminder_id):
+        """Remove a reminder; returns False if it was not scheduled"""
+        reminder = self._reminders.pop(reminder_id, None)
+        if reminder is None:
+            return False
+        reminder.version += 1
+        self._mark_stale()
+        return True
+
+    def reschedule(self, reminder_id, start, interval=None, count=None, until=None):
+        """Give an existing reminder a new recurrence rule; returns False if unknown"""
+        reminder = self._reminders.get(reminder_id)
+        if reminder is None:
+            return False
+        reminder.version += 1
+        self._mark_stale()
+        if reminder.set_rule(start, interval, count, until):
+            self._push(reminder)
+            self._notify()
+        else:
+            del self._reminders[reminder_id]
+        return True
+
+    def next_time(self):
+        """Time of the earliest pending occurrence, or None"""
+        heap = self._heap
+        while heap:
+            when, _, version, reminder = heap[0]
+            if version == reminder.version:
+                return when
+            heapq.heappop(heap)
+            self._stale -= 1
+        return None
+
+    def pop_due(self, now, limit=None):
+        """Remove and return up to limit (when, reminder) pairs due at now
+
+        Recurring reminders are pushed back with their next occurrence.
+        """
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now and (limit is None or len(due) < limit):
+            when, _, version, reminder = heapq.heappop(heap)
+            if version != reminder.version:
+                self._stale -= 1
+                continue
+            due.append((when, reminder))
+            self._advance(reminder)
+        return due
+
+    def _new_reminder(self, message, start, interval=None, count=None, until=None):
+        reminder = Reminder(next(self._ids), message)
+        if not reminder.set_rule(start, interval, count, until):
+            return None
+        self._reminders[reminder.id] = reminder
+        return reminder
+
+    def _push(self, reminder):
+        heapq.heappush(self._heap,
+                       (reminder.when, next(self._sequence), reminder.version, reminder))
+
+    def _advance(self, reminder):
+        """Queue the reminder's next occurrence, or drop it when there is none"""
+        if reminder.next_occurrence():
+            self._push(reminder)
+        else:
+            del self._reminders[reminder.id]
+
+    def _mark_stale(self):
+        self._stale += 1
+        heap = self._heap
+        if self._stale > _COMPACT_MIN and self._stale * 2 > len(heap):
+            heap[:] = [entry for entry in heap if entry[2] == entry[3].version]
+            heapq.heapify(heap)
+            self._stale = 0
+
+    def _notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+def _seconds(delay):
+    return delay.total_seconds() if isinstance(delay, timedelta) else delay
+
+def _clock_for(when):
+    """Current time in the same kind as when (a datetime or epoch seconds)"""
+    if isinstance(when, datetime):
+        return datetime.now(when.tzinfo)
+    return time.time()
+
+async def run_scheduler(scheduler, handle_batch, clock=None,
+                        batch_size=DEFAULT_BATCH_SIZE, exit_when_idle=True):
+    """Fire due reminders by calling handle_batch(list of (when, reminder))
+
+    handle_batch may be a coroutine function. The driver sleeps until the
+    next occurrence and wakes early when reminders are added or rescheduled.
+    It returns once the scheduler is empty (unless exit_when_idle is False);
+    cancel the task to stop it earlier. Without a clock, the current time is
+    taken as time.time() for epoch-second schedules and datetime.now() (in
+    the scheduled tzinfo) for datetime schedules.
+    """
+    wakeup = scheduler._wakeup = asyncio.Event()
+    try:
+        while True:
+            now = clock() if clock is not None else _clock_for(scheduler.next_time())
+            batch = scheduler.pop_due(now, batch_size)
+            if batch:
+                result = handle_batch(batch)
+                if inspect.isawaitable(result):
+                    await result
+                # Let other tasks run between batches
+                await asyncio.sleep(0)
+                continue
+            next_time = scheduler.next_time()
+            if next_time is None and exit_when_idle:
+                return
+            wakeup.clear()
+            delay = None if next_time is None else max(0.0, _seconds(next_time - now))
+            try:
+                await asyncio.wait_for(wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        scheduler._wakeup = None
+
+def main():
+    print("=== Reminder Scheduler ===\n")
+
+    # 200,000 daily reminders spread over one day, in a single heapify
+    scheduler = ReminderScheduler()
+    now = time.time()
+    start = time.perf_counter()
+    scheduler.schedule_many((f"reminder {i}", now + i * DAY / 200_000, daily())
+                            for i in range(200_000))
+    print(f"Scheduled {len(scheduler):,} daily reminders in "
+          f"{time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    due = scheduler.pop_due(now + 3600)
+    print(f"Fired {len(due):,} reminders due in the first hour in "
+          f"{time.perf_counter() - start:.2f} s; next one at +"
+          f"{scheduler.next_time() - now:.1f} s")
+    for reminder_id in range(1, 100_001):
+        scheduler.cancel(reminder_id)
+    print(f"Cancelled half of them, {len(scheduler):,} left")
+
+    # The asyncio driver on a small schedule
+    print("\nAsync driver:")
+    scheduler = ReminderScheduler()
+    now = time.time()
+    scheduler.schedule("stretch", now + 0.1, 0.2, count=3)
+    scheduler.schedule("drink water", now + 0.15, 0.3, count=2)
+    once = scheduler.schedule("stand up", now + 0.05)
+    scheduler.reschedule(once, now + 0.25)
+
+    def show(batch):
+        for when, reminder in batch:
+            print(f"  +{when - now:.2f} s: {reminder.message}")
+
+    asyncio.run(run_scheduler(scheduler, show))
+
+if __name__ == "__main__":
+    main()
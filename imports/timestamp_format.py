@@ -0,0 +1,185 @@
+"""
+Timestamp Format: Bulk strftime with precompiled format plans
+compile_format() splits a strftime pattern once into literal text, date
+fields and time fields. Date fields (names, year, month, ...) are rendered
+with the real strftime once per day and reused while consecutive timestamps
+fall on the same day; time fields come from lookup tables, so a formatted
+timestamp costs a few list stores and one join instead of a strftime call.
+Patterns using directives without a plan (%c, %z, %Z, ...) fall back to
+strftime per timestamp, so every pattern still works.
+"""
+
+import re
+import time
+from datetime import date, datetime, timezone
+
+_DIRECTIVE = re.compile(r"%(.)", re.DOTALL)
+# Directives that only depend on the calendar day
+_DATE_DIRECTIVES = frozenset("aAbBCdDeFgGhjmuUVwWxyY")
+_TIME_DIRECTIVES = frozenset("HIMSpf")
+_TWO_DIGITS = [f"{n:02d}" for n in range(100)]
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def _meridiem_names():
+    """Locale's AM/PM strings, looked up once"""
+    return tuple(time.strftime("%p", (2000, 1, 1, hour, 0, 0, 5, 1, -1)) for hour in (0, 12))
+
+class TimestampFormat:
+    """A strftime pattern compiled into a per-day template and time slots"""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        # template: literal and date-field strings; time fields are None slots
+        self._date_parts = []
+        self._time_slots = []
+        self.fallback = False
+        text = []
+        last = 0
+        for match in _DIRECTIVE.finditer(pattern):
+            text.append(pattern[last:match.start()].replace("%", "%%"))
+            last = match.end()
+            directive = match.group(1)
+            if directive == "%":
+                text.append("%%")
+            elif directive in _DATE_DIRECTIVES:
+                text.append(match.group(0))
+            elif directive in _TIME_DIRECTIVES:
+                self._flush_text(text)
+                self._time_slots.append((len(self._date_parts), directive))
+                self._date_parts.append(None)
+            else:
+                self.fallback = True
+        text.append(pattern[last:].replace("%", "%%"))
+        self._flush_text(text)
+        self._meridiem = _meridiem_names() if any(d in "Ip" for _, d in self._time_slots) else None
+
+    def _flush_text(self, text):
+        # Literal text and date fields are kept as one strftime pattern per run
+        if text:
+            self._date_parts.append("".join(text))
+            text.clear()
+
+    def _parts_for_day(self, day):
+        """A new template list with the date fields rendered for day"""
+        return [None if part is None else day.strftime(part) for part in self._date_parts]
+
+    def _render(self, parts, hour, minute, second, microsecond):
+        for index, directive in self._time_slots:
+            if directive == "H":
+                parts[index] = _TWO_DIGITS[hour]
+            elif directive == "M":
+                parts[index] = _TWO_DIGITS[minute]
+            elif directive == "S":
+                parts[index] = _TWO_DIGITS[second]
+            elif directive == "I":
+                parts[index] = _TWO_DIGITS[hour % 12 or 12]
+            elif directive == "p":
+                parts[index] = self._meridiem[hour >= 12]
+            else:
+                parts[index] = f"{microsecond:06d}"
+        return "".join(parts)
+
+    def format(self, timestamp, tz=None):
+        """Format one datetime or epoch-seconds value"""
+        return self.format_many((timestamp,), tz=tz)[0]
+
+    def format_many(self, timestamps, out=None, tz=None):
+        """Format datetimes or epoch seconds into out (a reused list) and return it
+
+        Epoch seconds are shown in local time, or in tz if given; integer
+        seconds with tz=timezone.utc skip datetime objects entirely.
+        The compiled plan is shared and read-only; the rendered day is kept
+        in locals, so one format may be used from several threads at once.
+        """
+        if out is None:
+            out = []
+        else:
+            out.clear()
+        if self.fallback:
+            pattern = self.pattern
+            for timestamp in timestamps:
+                if not isinstance(timestamp, datetime):
+                    timestamp = datetime.fromtimestamp(timestamp, tz)
+                out.append(timestamp.strftime(pattern))
+            return out
+
+        append = out.append
+        render = self._render
+        parts_for_day = self._parts_for_day
+        utc = tz is timezone.utc
+        # Day ordinal and template of the previous timestamp; parts belongs
+        # to this call only, since render() writes the time fields into it
+        day_key = parts = None
+        for timestamp in timestamps:
+            if utc and type(timestamp) is int:
+                days, seconds = divmod(timestamp, 86400)
+                ordinal = _EPOCH_ORDINAL + days
+                if ordinal != day_key:
+                    parts = parts_for_day(date.fromordinal(ordinal))
+                    day_key = ordinal
+                minutes, second = divmod(seconds, 60)
+                append(render(parts, minutes // 60, minutes % 60, second, 0))
+                continue
+            if not isinstance(timestamp, datetime):
+                timestamp = datetime.fromtimestamp(timestamp, tz)
+            ordinal = timestamp.toordinal()
+            if ordinal != day_key:
+                parts = parts_for_day(timestamp)
+                day_key = ordinal
+            append(render(parts, timestamp.hour, timestamp.minute,
+                          timestamp.second, timestamp.microsecond))
+        return out
+
+    def write_many(self, timestamps, stream, end="\n", tz=None, chunk_size=10000):
+        """Write formatted timestamps to stream, one chunk at a time"""
+        buffer = []
+        chunk = []
+        for timestamp in timestamps:
+            chunk.append(timestamp)
+            if len(chunk) >= chunk_size:
+                stream.write(end.join(self.format_many(chunk, buffer, tz)) + end)
+                chunk.clear()
+        if chunk:
+            stream.write(end.join(self.format_many(chunk, buffer, tz)) + end)
+
+# pattern -> TimestampFormat
+_compiled = {}
+
+def compile_format(pattern):
+    """Compiled plan for a strftime pattern (cached per pattern)"""
+    compiled = _compiled.get(pattern)
+    if compiled is None:
+        compiled = _compiled[pattern] = TimestampFormat(pattern)
+    return compiled
+
+def format_many(timestamps, pattern, out=None, tz=None):
+    """Format many timestamps with pattern; see TimestampFormat.format_many"""
+    return compile_format(pattern).format_many(timestamps, out, tz)
+
+def main():
+    print("=== Timestamp Format ===\n")
+    pattern = "%Y-%m-%d %H:%M:%S"
+    start = int(time.time())
+    seconds = list(range(start, start + 200_000, 3))
+    stamps = [datetime.fromtimestamp(s) for s in seconds]
+    formatter = compile_format(pattern)
+
+    begin = time.perf_counter()
+    expected = [stamp.strftime(pattern) for stamp in stamps]
+    plain = time.perf_counter() - begin
+    begin = time.perf_counter()
+    formatted = formatter.format_many(stamps)
+    compiled = time.perf_counter() - begin
+    print(f"{len(stamps):,} datetimes: strftime {plain:.3f} s, compiled {compiled:.3f} s, "
+          f"same output: {formatted == expected}")
+
+    utc = [datetime.fromtimestamp(s, timezone.utc).strftime(pattern) for s in seconds]
+    begin = time.perf_counter()
+    formatted = formatter.format_many(seconds, tz=timezone.utc)
+    print(f"{len(seconds):,} UTC epoch seconds: {time.perf_counter() - begin:.3f} s, "
+          f"same output: {formatted == utc}")
+    print(formatter.format(stamps[0]), "|",
+          compile_format("%A, %B %d at %I:%M %p").format(stamps[0]))
+
+if __name__ == "__main__":
+    main()
@@ -10,29 +10,123 @@ The solutions of this quadratic equation is given by:
 𝑏2 )1/2
 (−𝑏 ± ( − 4𝑎𝑐)
 /(2𝑎)
+
+The textbook formula loses precision when b**2 is much larger than 4ac, so
+the roots are computed as q / a and c / q with q = -(b + sign(b) * sqrt(d)) / 2.
+
+Usage:
+    python 10.py                       # solve one equation from input()
+    python 10.py coefficients.csv      # solve every "a,b,c" row of a CSV file
+    python 10.py - < coefficients.csv  # same, reading from stdin
 '''
 
+import csv
 import math
-# Input coefficients
-a = float(input("Enter coefficient a: "))
-b = float(input("Enter coefficient b: "))
-c = float(input("Enter coefficient c: "))
-# Calculate the discriminant
-discriminant = b**2 - 4*a*c
-# Check if the discriminant is positive, negative, or zero
-if discriminant > 0:
-# Two real and distinct roots
-    root1 = (-b + math.sqrt(discriminant)) / (2*a)
-    root2 = (-b - math.sqrt(discriminant)) / (2*a)
-    print(f"Root 1: {root1}")
-    print(f"Root 2: {root2}")
-elif discriminant == 0:
-# One real root (repeated)
-    root = -b / (2*a)
-    print(f"Root: {root}")
-else:
-# Complex roots
-    real_part = -b / (2*a)
-    imaginary_part = math.sqrt(abs(discriminant)) / (2*a)
-    print(f"Root 1: {real_part} + {imaginary_part}i")
-    print(f"Root 2: {real_part} - {imaginary_part}i")
\ No newline at end of file
+import sys
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rows solved per batch when streaming a CSV file
+CHUNK_ROWS = 65536
+
+def solve_quadratic(a, b, c):
+    """Return both roots of ax^2 + bx + c = 0 (complex when d < 0)"""
+    if a == 0:
+        raise ValueError("Coefficient a must not be zero")
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        root = complex(-b, math.sqrt(-discriminant)) / (2 * a)
+        return root, root.conjugate()
+    q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+    if q == 0:
+        return 0.0, 0.0
+    # Keep the textbook order: root1 takes +sqrt(d), root2 takes -sqrt(d)
+    if b < 0:
+        return q / a, c / q
+    return c / q, q / a
+
+def solve_quadratic_many(a, b, c):
+    """Solve many equations from coefficient sequences; returns (roots1, roots2)
+
+    With NumPy the work is vectorized and the root arrays are complex only
+    when some discriminant is negative. Without NumPy, lists are returned.
+    """
+    if np is None:
+        roots = [solve_quadratic(*row) for row in zip(a, b, c)]
+        return [r[0] for r in roots], [r[1] for r in roots]
+    a, b, c = (np.asarray(x, dtype=float) for x in (a, b, c))
+    if np.any(a == 0):
+        raise ValueError("Coefficient a must not be zero")
+    discriminant = b * b - 4 * a * c
+    if np.all(discriminant >= 0):
+        sqrt_d = np.sqrt(discriminant)
+    else:
+        sqrt_d = np.sqrt(discriminant.astype(complex))
+    q = -0.5 * (b + np.where(b < 0, -1.0, 1.0) * sqrt_d)
+    zero = q == 0
+    outer = np.where(zero, 0, q / a)
+    inner = np.where(zero, 0, c / np.where(zero, 1, q))
+    negative_b = b < 0
+    return np.where(negative_b, outer, inner), np.where(negative_b, inner, outer)
+
+def solve_quadratic_csv(infile, outfile, chunk_rows=CHUNK_ROWS):
+    """Stream "a,b,c" rows from infile and write "a,b,c,root1,root2" rows
+
+    Rows are read and solved chunk_rows at a time, so memory stays bounded
+    no matter how large the input is. Returns the number of rows solved.
+    """
+    reader = csv.reader(infile)
+    writer = csv.writer(outfile)
+    solved = 0
+    while True:
+        chunk = list(islice(reader, chunk_rows))
+        if not chunk:
+            return solved
+        # Blank lines are skipped; a chunk of only blank lines is not the end
+        rows = [row for row in chunk if row]
+        if not rows:
+            continue
+        a, b, c = ([float(row[i]) for row in rows] for i in range(3))
+        roots1, roots2 = solve_quadratic_many(a, b, c)
+        writer.writerows(zip(a, b, c, _plain(roots1), _plain(roots2)))
+        solved += len(rows)
+
+def _plain(roots):
+    """Python numbers for output, with real roots written without a 0j part"""
+    for root in (roots.tolist() if np is not None else roots):
+        yield root.real if isinstance(root, complex) and root.imag == 0 else root
+
+def main():
+    # Input coefficients
+    a = float(input("Enter coefficient a: "))
+    b = float(input("Enter coefficient b: "))
+    c = float(input("Enter coefficient c: "))
+    # Calculate the discriminant
+    discriminant = b**2 - 4*a*c
+    root1, root2 = solve_quadratic(a, b, c)
+    # Check if the discriminant is positive, negative, or zero
+    if discriminant > 0:
+    # Two real and distinct roots
+        print(f"Root 1: {root1}")
+        print(f"Root 2: {root2}")
+    elif discriminant == 0:
+    # One real root (repeated)
+        print(f"Root: {root1}")
+    else:
+    # Complex roots
+        print(f"Root 1: {root1.real} + {root1.imag}i")
+        print(f"Root 2: {root2.real} - {root1.imag}i")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "-":
+            solve_quadratic_csv(sys.stdin, sys.stdout)
+        else:
+            with open(sys.argv[1], newline="") as f:
+                solve_quadratic_csv(f, sys.stdout)
+    else:
+        main()
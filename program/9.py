@@ -1,7 +1,51 @@
 #Write a Python program to display calendar.
 
+#Bulk mode: python 9.py START_YEAR END_YEAR [OUTPUT_FILE]
+#writes every month from START_YEAR to END_YEAR in the same layout as calendar.month().
+#A month grid only depends on the weekday of the 1st and the number of days,
+#so each of those (at most 28) grids is rendered once and reused.
+
 import calendar
-year = int(input("Enter year: "))
-month = int(input("Enter month: "))
-cal = calendar.month(year, month)
-print(cal)
\ No newline at end of file
+import sys
+
+# (weekday of the 1st, days in month) -> rendered week header and weeks
+_month_grids = {}
+
+def month_grid(start_weekday, days):
+    key = (start_weekday, days)
+    grid = _month_grids.get(key)
+    if grid is None:
+        text_calendar = calendar.TextCalendar()
+        lines = [text_calendar.formatweekheader(2).rstrip()]
+        offset = (start_weekday - text_calendar.firstweekday) % 7
+        cells = ["  "] * offset + [f"{day:2}" for day in range(1, days + 1)]
+        for start in range(0, len(cells), 7):
+            lines.append(" ".join(cells[start:start + 7]).rstrip())
+        grid = "\n".join(lines) + "\n"
+        _month_grids[key] = grid
+    return grid
+
+def render_month(year, month):
+    # Same text as calendar.month(year, month)
+    start_weekday, days = calendar.monthrange(year, month)
+    title = f"{calendar.month_name[month]} {year}".center(20).rstrip()
+    return title + "\n" + month_grid(start_weekday, days)
+
+def write_calendars(start_year, end_year, stream):
+    # One write per year keeps the number of system calls small
+    for year in range(start_year, end_year + 1):
+        stream.write("".join(render_month(year, month) + "\n" for month in range(1, 13)))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        start_year, end_year = int(sys.argv[1]), int(sys.argv[2])
+        if len(sys.argv) > 3:
+            with open(sys.argv[3], "w", buffering=1 << 20) as f:
+                write_calendars(start_year, end_year, f)
+        else:
+            write_calendars(start_year, end_year, sys.stdout)
+    else:
+        year = int(input("Enter year: "))
+        month = int(input("Enter month: "))
+        cal = calendar.month(year, month)
+        print(cal)
@@ -0,0 +1,177 @@
+#Bulk unit conversion built on the formulas from 7.py (km -> miles) and 8.py (Celsius -> Fahrenheit).
+#Every conversion between two units of the same kind is one affine map y = scale * x + offset,
+#so chains of conversions collapse into a single multiply-add per value.
+
+import csv
+import os
+import sys
+from array import array
+from itertools import islice
+
+# Shared helpers live next door in imports/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'imports'))
+from math_utils import numpy_for
+
+# Values converted per step when working through buffers and files
+CHUNK_SIZE = 1 << 16
+
+class AffineTransform:
+    """y = scale * x + offset"""
+
+    __slots__ = ('scale', 'offset')
+
+    def __init__(self, scale=1.0, offset=0.0):
+        self.scale = scale
+        self.offset = offset
+
+    def then(self, other):
+        """Transform that applies self first and other second"""
+        return AffineTransform(other.scale * self.scale, other.scale * self.offset + other.offset)
+
+    def __call__(self, value):
+        return self.scale * value + self.offset
+
+    def __repr__(self):
+        return f"AffineTransform(scale={self.scale!r}, offset={self.offset!r})"
+
+class UnitRegistry:
+    """Units grouped by kind, each defined as an affine map from the kind's base unit"""
+
+    def __init__(self):
+        # unit -> (kind, AffineTransform from the base unit to this unit)
+        self._units = {}
+
+    def define(self, unit, kind, scale=1.0, offset=0.0):
+        """Register unit so that value_in_unit = scale * value_in_base + offset"""
+        if scale == 0:
+            raise ValueError("Unit scale must not be zero")
+        self._units[unit] = (kind, AffineTransform(scale, offset))
+
+    def units(self, kind=None):
+        """Names of the registered units, optionally of one kind"""
+        return [u for u, (k, _) in self._units.items() if kind is None or k == kind]
+
+    def _lookup(self, unit):
+        try:
+            return self._units[unit]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {unit}") from None
+
+    def transform(self, *units):
+        """Compose the conversions along units (two or more) into one transform"""
+        if len(units) < 2:
+            raise ValueError("A conversion needs at least two units")
+        result = AffineTransform()
+        for source, target in zip(units, units[1:]):
+            source_kind, to_source = self._lookup(source)
+            target_kind, to_target = self._lookup(target)
+            if source_kind != target_kind:
+                raise ValueError(f"Cannot convert {source_kind} ({source}) to {target_kind} ({target})")
+            # Undo source's map back to the base unit, then apply target's map
+            scale = to_target.scale / to_source.scale
+            step = AffineTransform(scale, to_target.offset - to_source.offset * scale)
+            result = result.then(step)
+        return result
+
+    def convert(self, value, *units):
+        """Convert one value along units, e.g. convert(5, 'km', 'mile')"""
+        return self.transform(*units)(value)
+
+    def convert_buffer(self, values, *units, out=None):
+        """Convert a whole buffer at once
+
+        values may be a list, an array.array, a memoryview of doubles or a
+        NumPy array. The result goes into out (which may be values itself,
+        for in-place conversion) or into a new buffer of the same kind.
+        """
+        transform = self.transform(*units)
+        scale, offset = transform.scale, transform.offset
+        np = numpy_for(values)
+        if np is not None:
+            out = np.multiply(values, scale, out=out)
+            out += offset
+            return out
+        if out is None:
+            out = list(values) if isinstance(values, list) else array('d', values)
+        count = len(values)
+        if len(out) != count:
+            raise ValueError("Output buffer must have the same length as the input")
+        for start in range(0, count, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, count)
+            converted = [scale * v + offset for v in values[start:stop]]
+            out[start:stop] = converted if isinstance(out, list) else array('d', converted)
+        return out
+
+    def convert_binary_file(self, source_path, target_path, *units, chunk_size=CHUNK_SIZE):
+        """Convert a file of native float64 values in fixed-size chunks"""
+        transform = self.transform(*units)
+        buffer = array('d', bytes(8 * chunk_size))
+        view = memoryview(buffer).cast('B')
+        converted = 0
+        with open(source_path, 'rb') as source, open(target_path, 'wb') as target:
+            while True:
+                size = source.readinto(view)
+                if not size:
+                    return converted
+                if size % 8:
+                    # readinto may stop short; top up to whole doubles
+                    size += source.readinto(view[size:size + 8 - size % 8])
+                    if size % 8:
+                        raise ValueError(f"{source_path} does not hold whole float64 values")
+                count = size // 8
+                chunk = buffer if count == chunk_size else buffer[:count]
+                self._apply(transform, chunk)
+                target.write(chunk)
+                converted += count
+
+    def convert_csv(self, infile, outfile, column, *units, header=False, chunk_rows=CHUNK_SIZE):
+        """Stream CSV rows, converting one column in place, chunk_rows at a time
+
+        Blank rows are copied through; returns the number of rows converted.
+        """
+        transform = self.transform(*units)
+        reader = csv.reader(infile)
+        writer = csv.writer(outfile)
+        if header:
+            writer.writerow(next(reader, []))
+        converted = 0
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                return converted
+            for row in rows:
+                if row:
+                    row[column] = transform(float(row[column]))
+                    converted += 1
+            writer.writerows(rows)
+
+    @staticmethod
+    def _apply(transform, buffer):
+        """Convert an array('d') in place"""
+        scale, offset = transform.scale, transform.offset
+        buffer[:] = array('d', [scale * v + offset for v in buffer])
+
+def default_registry():
+    """Registry with the length and temperature units used by the programs"""
+    registry = UnitRegistry()
+    # Length, base unit kilometers; 1 kilometer = 0.621371 miles (7.py)
+    registry.define('km', 'length')
+    registry.define('m', 'length', 1000.0)
+    registry.define('mile', 'length', 0.621371)
+    registry.define('ft', 'length', 1000.0 / 0.3048)
+    # Temperature, base unit Celsius; Fahrenheit = (Celsius * 9/5) + 32 (8.py)
+    registry.define('celsius', 'temperature')
+    registry.define('fahrenheit', 'temperature', 9 / 5, 32.0)
+    registry.define('kelvin', 'temperature', 1.0, 273.15)
+    return registry
+
+registry = default_registry()
+
+if __name__ == "__main__":
+    # Usage: python unit_conversions.py FROM TO [COLUMN] < input.csv > output.csv
+    if len(sys.argv) < 3:
+        print(f"Units: {', '.join(registry.units())}")
+        print("Usage: python unit_conversions.py FROM TO [COLUMN] < input.csv > output.csv")
+    else:
+        column = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        registry.convert_csv(sys.stdin, sys.stdout, column, sys.argv[1], sys.argv[2])